@@ -0,0 +1,40 @@
+"""convert audit_log json columns to jsonb
+
+Revision ID: 3f7b2c9d1e4a
+Revises: 8531f27326c5
+Create Date: 2025-07-14 10:12:41.218305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3f7b2c9d1e4a'
+down_revision = '8531f27326c5'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = ('before_state', 'after_state', 'custom_metadata')
+
+
+def upgrade():
+    for column in JSON_COLUMNS:
+        op.alter_column('audit_log', column,
+                   existing_type=postgresql.JSON(astext_type=sa.Text()),
+                   type_=postgresql.JSONB(astext_type=sa.Text()),
+                   existing_nullable=True,
+                   postgresql_using=f'{column}::jsonb')
+    op.create_index('idx_audit_metadata_gin', 'audit_log', ['custom_metadata'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('idx_audit_metadata_gin', table_name='audit_log', postgresql_using='gin')
+    for column in JSON_COLUMNS:
+        op.alter_column('audit_log', column,
+                   existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                   type_=postgresql.JSON(astext_type=sa.Text()),
+                   existing_nullable=True,
+                   postgresql_using=f'{column}::json')
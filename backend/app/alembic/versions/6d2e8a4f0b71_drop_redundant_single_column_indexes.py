@@ -0,0 +1,46 @@
+"""drop redundant single column indexes
+
+Revision ID: 6d2e8a4f0b71
+Revises: 3f7b2c9d1e4a
+Create Date: 2025-07-15 09:41:07.582913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = '6d2e8a4f0b71'
+down_revision = '3f7b2c9d1e4a'
+branch_labels = None
+depends_on = None
+
+# Indexes that duplicate another index or a composite prefix, or back no query
+REDUNDANT_INDEXES = [
+    ('audit_log', 'ix_audit_log_action', ['action']),
+    ('audit_log', 'ix_audit_log_resource_type', ['resource_type']),
+    ('audit_log', 'ix_audit_log_severity', ['severity']),
+    ('audit_log', 'ix_audit_log_tenant_id', ['tenant_id']),
+    ('audit_log', 'ix_audit_log_timestamp', ['timestamp']),
+    ('audit_log', 'ix_audit_log_ip_address', ['ip_address']),
+    ('audit_log', 'ix_audit_log_session_id', ['session_id']),
+    ('audit_log', 'idx_audit_tenant_timestamp_partition', ['tenant_id', 'timestamp']),
+    ('user', 'ix_user_is_active', ['is_active']),
+    ('user', 'ix_user_full_name', ['full_name']),
+    ('user', 'ix_user_role', ['role']),
+    ('user', 'ix_user_last_login_at', ['last_login_at']),
+    ('item', 'ix_item_title', ['title']),
+    ('item', 'ix_item_created_at', ['created_at']),
+    ('item', 'ix_item_updated_at', ['updated_at']),
+]
+
+
+def upgrade():
+    for table_name, index_name, _ in REDUNDANT_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade():
+    for table_name, index_name, columns in REDUNDANT_INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
@@ -0,0 +1,34 @@
+"""convert tenant features_enabled to jsonb
+
+Revision ID: a2f6c3e81b59
+Revises: e7a3b9c05d48
+Create Date: 2025-07-18 09:41:27.530194
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2f6c3e81b59'
+down_revision = 'e7a3b9c05d48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('tenant', 'features_enabled',
+               existing_type=postgresql.JSON(astext_type=sa.Text()),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=False,
+               postgresql_using='features_enabled::jsonb')
+
+
+def downgrade():
+    op.alter_column('tenant', 'features_enabled',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=postgresql.JSON(astext_type=sa.Text()),
+               existing_nullable=False,
+               postgresql_using='features_enabled::json')
@@ -0,0 +1,42 @@
+"""lead composite indexes with selective columns
+
+Revision ID: b5c1f7e93a20
+Revises: 6d2e8a4f0b71
+Create Date: 2025-07-15 14:22:53.104876
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5c1f7e93a20'
+down_revision = '6d2e8a4f0b71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('idx_audit_user_tenant', 'audit_log', ['user_id', 'tenant_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_audit_resource_tenant', 'audit_log', ['resource_id', 'resource_type', 'tenant_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_user_email_tenant', 'user', ['email', 'tenant_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('idx_audit_tenant_user', table_name='audit_log', postgresql_concurrently=True)
+        op.drop_index('idx_audit_tenant_resource', table_name='audit_log', postgresql_concurrently=True)
+        op.drop_index('ix_audit_log_user_id', table_name='audit_log', postgresql_concurrently=True)
+        op.drop_index('ix_audit_log_resource_id', table_name='audit_log', postgresql_concurrently=True)
+        op.drop_index('idx_user_tenant_email', table_name='user', postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('idx_user_tenant_email', 'user', ['tenant_id', 'email'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_audit_log_resource_id', 'audit_log', ['resource_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_audit_log_user_id', 'audit_log', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_audit_tenant_resource', 'audit_log', ['tenant_id', 'resource_type', 'resource_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_audit_tenant_user', 'audit_log', ['tenant_id', 'user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('idx_user_email_tenant', table_name='user', postgresql_concurrently=True)
+        op.drop_index('idx_audit_resource_tenant', table_name='audit_log', postgresql_concurrently=True)
+        op.drop_index('idx_audit_user_tenant', table_name='audit_log', postgresql_concurrently=True)
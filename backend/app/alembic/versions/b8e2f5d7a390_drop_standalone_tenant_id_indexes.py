@@ -0,0 +1,35 @@
+"""drop standalone tenant_id indexes
+
+Revision ID: b8e2f5d7a390
+Revises: f3d8a1c4e602
+Create Date: 2025-07-21 10:22:36.470915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8e2f5d7a390'
+down_revision = 'f3d8a1c4e602'
+branch_labels = None
+depends_on = None
+
+# Each is a prefix of a composite index leading with tenant_id
+# (idx_user_tenant_active, idx_item_tenant_created, idx_tenant_metrics_date)
+TENANT_ID_INDEXES = [
+    ('user', 'ix_user_tenant_id'),
+    ('item', 'ix_item_tenant_id'),
+    ('tenant_metrics', 'ix_tenant_metrics_tenant_id'),
+]
+
+
+def upgrade():
+    for table_name, index_name in TENANT_ID_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade():
+    for table_name, index_name in TENANT_ID_INDEXES:
+        op.create_index(index_name, table_name, ['tenant_id'], unique=False)
@@ -0,0 +1,30 @@
+"""partial index for high severity audit logs
+
+Revision ID: c8e4d2a6f913
+Revises: b5c1f7e93a20
+Create Date: 2025-07-16 11:05:38.671240
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8e4d2a6f913'
+down_revision = 'b5c1f7e93a20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('idx_audit_tenant_severity_hot', 'audit_log', ['tenant_id', 'timestamp'], unique=False, postgresql_where=sa.text("severity IN ('ERROR', 'CRITICAL')"), postgresql_concurrently=True)
+        op.drop_index('idx_audit_tenant_severity', table_name='audit_log', postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index('idx_audit_tenant_severity', 'audit_log', ['tenant_id', 'severity'], unique=False, postgresql_concurrently=True)
+        op.drop_index('idx_audit_tenant_severity_hot', table_name='audit_log', postgresql_concurrently=True)
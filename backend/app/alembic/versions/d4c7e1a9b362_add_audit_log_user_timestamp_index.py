@@ -0,0 +1,27 @@
+"""add audit_log (user_id, timestamp) index
+
+Revision ID: d4c7e1a9b362
+Revises: b8e2f5d7a390
+Create Date: 2025-07-22 09:14:52.318406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4c7e1a9b362'
+down_revision = 'b8e2f5d7a390'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Created on the partitioned parent, which builds it on every partition;
+    # CONCURRENTLY is not supported for partitioned tables
+    op.create_index('idx_audit_user_timestamp', 'audit_log', ['user_id', 'timestamp'], unique=False)
+
+
+def downgrade():
+    op.drop_index('idx_audit_user_timestamp', table_name='audit_log')
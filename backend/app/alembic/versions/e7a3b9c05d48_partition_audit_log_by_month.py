@@ -0,0 +1,79 @@
+"""partition audit_log by month
+
+Revision ID: e7a3b9c05d48
+Revises: c8e4d2a6f913
+Create Date: 2025-07-17 16:30:12.904517
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a3b9c05d48'
+down_revision = 'c8e4d2a6f913'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+
+def _next_month(month: datetime) -> datetime:
+    return datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_indexes():
+    op.create_index('idx_audit_tenant_timestamp', 'audit_log', ['tenant_id', 'timestamp'], unique=False)
+    op.create_index('idx_audit_tenant_action', 'audit_log', ['tenant_id', 'action'], unique=False)
+    op.create_index('idx_audit_tenant_severity_hot', 'audit_log', ['tenant_id', 'timestamp'], unique=False, postgresql_where=sa.text("severity IN ('ERROR', 'CRITICAL')"))
+    op.create_index('idx_audit_user_tenant', 'audit_log', ['user_id', 'tenant_id'], unique=False)
+    op.create_index('idx_audit_resource_tenant', 'audit_log', ['resource_id', 'resource_type', 'tenant_id'], unique=False)
+    op.create_index('idx_audit_timestamp_partition', 'audit_log', ['timestamp'], unique=False)
+    op.create_index('idx_audit_metadata_gin', 'audit_log', ['custom_metadata'], unique=False, postgresql_using='gin')
+    op.create_foreign_key('audit_log_tenant_id_fkey', 'audit_log', 'tenant', ['tenant_id'], ['id'])
+    op.create_foreign_key('audit_log_user_id_fkey', 'audit_log', 'user', ['user_id'], ['id'])
+
+
+def upgrade():
+    op.rename_table('audit_log', 'audit_log_unpartitioned')
+    op.execute('''
+        CREATE TABLE audit_log (LIKE audit_log_unpartitioned INCLUDING DEFAULTS)
+        PARTITION BY RANGE ("timestamp")
+    ''')
+
+    # One partition per month from the oldest row until a few months ahead;
+    # the default partition catches anything outside that window
+    oldest = op.get_bind().execute(sa.text('SELECT min("timestamp") FROM audit_log_unpartitioned')).scalar()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    month = datetime((oldest or now).year, (oldest or now).month, 1)
+    last = datetime(now.year, now.month, 1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        end = _next_month(month)
+        op.execute(f'''
+            CREATE TABLE audit_log_y{month:%Y}m{month:%m} PARTITION OF audit_log
+            FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')
+        ''')
+        month = end
+    op.execute('CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT')
+
+    op.execute('INSERT INTO audit_log SELECT * FROM audit_log_unpartitioned')
+    op.drop_table('audit_log_unpartitioned')
+
+    op.create_primary_key('audit_log_pkey', 'audit_log', ['id', 'timestamp'])
+    _create_indexes()
+
+
+def downgrade():
+    op.rename_table('audit_log', 'audit_log_partitioned')
+    op.execute('CREATE TABLE audit_log (LIKE audit_log_partitioned INCLUDING DEFAULTS)')
+    op.execute('INSERT INTO audit_log SELECT * FROM audit_log_partitioned')
+    # Dropping the parent drops every partition with it
+    op.drop_table('audit_log_partitioned')
+
+    op.create_primary_key('audit_log_pkey', 'audit_log', ['id'])
+    _create_indexes()
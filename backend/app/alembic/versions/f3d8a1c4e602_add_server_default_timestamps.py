@@ -0,0 +1,40 @@
+"""add server default timestamps
+
+Revision ID: f3d8a1c4e602
+Revises: a2f6c3e81b59
+Create Date: 2025-07-18 14:05:52.118734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3d8a1c4e602'
+down_revision = 'a2f6c3e81b59'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = (
+    ('tenant', 'created_at'),
+    ('tenant', 'updated_at'),
+    ('item', 'created_at'),
+    ('item', 'updated_at'),
+    ('audit_log', 'timestamp'),
+    ('tenant_metrics', 'date'),
+)
+
+
+def upgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column,
+                   existing_type=sa.DateTime(),
+                   server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column,
+                   existing_type=sa.DateTime(),
+                   server_default=None)
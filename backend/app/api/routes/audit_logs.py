@@ -2,29 +2,37 @@ import asyncio
 import csv
 import io
 import uuid
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
-from sqlmodel import col, func, select
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session, col, func, select
 from starlette.responses import StreamingResponse
 
+from app import crud
 from app.api.deps import (
     CurrentUser,
     SessionDep,
     get_current_active_superuser,
 )
+from app.core.async_audit import audit_writer
+from app.core.audit_file_sink import audit_file_sink
+from app.core.db import get_session
 from app.models import (
     AuditAction,
     AuditLog,
     AuditLogCreate,
-    AuditLogExport,
+    AuditLogIds,
     AuditLogPublic,
     AuditLogsPublic,
     AuditLogUpdate,
     AuditSeverity,
     Message,
+    User,
     UserRole,
+    uuid7,
 )
 
 router = APIRouter(prefix="/audit-logs", tags=["audit-logs"])
@@ -122,32 +130,59 @@ def read_audit_logs(
     )
 
 
+def _check_audit_log_owner(audit_log_in: AuditLogCreate, current_user: User) -> None:
+    if str(audit_log_in.user_id) != str(current_user.id):
+        raise HTTPException(
+            status_code=403,
+            detail="You can only create audit logs for your own actions",
+        )
+    if str(audit_log_in.tenant_id) != str(current_user.tenant_id):
+        raise HTTPException(
+            status_code=403,
+            detail="You can only create audit logs for your own tenant",
+        )
+
+
+def _check_audit_log_references(session: Session, audit_log_in: AuditLogCreate) -> None:
+    # Queued entries are written after the response is sent, so catch foreign
+    # keys that would fail the insert while the caller can still be told
+    if not session.get(User, audit_log_in.user_id):
+        raise HTTPException(status_code=400, detail="Audit log user does not exist")
+    if not crud.get_tenant_by_id(session=session, tenant_id=audit_log_in.tenant_id):
+        raise HTTPException(status_code=400, detail="Audit log tenant does not exist")
+
+
+def _insert_audit_log(session: Session, audit_log_data: dict[str, Any]) -> None:
+    session.add(AuditLog(**audit_log_data))
+    session.commit()
+
+
 @router.post(
     "/",
     response_model=AuditLogPublic,
 )
-def create_audit_log(
+async def create_audit_log(
     *,
     session: SessionDep,
     request: Request,
     audit_log_in: AuditLogCreate,
     current_user: CurrentUser,
+    sync: bool = Query(False, description="Write immediately instead of queueing the entry"),
 ) -> Any:
     """
     Create new audit log entry (authenticated users).
+
+    Entries are inserted before this returns unless the audit file sink or the
+    background audit writer is enabled; those append or queue the entry and
+    write it later, so it may not be readable yet (or, if the process dies,
+    ever). Pass ``sync=true`` to always insert immediately.
     """
-    # Only restrict user_id and tenant_id for non-admins
+    # Only restrict user_id and tenant_id for non-admins; those are the
+    # caller's own, so only an admin's references need checking
     if current_user.role != UserRole.ADMIN:
-        if str(audit_log_in.user_id) != str(current_user.id):
-            raise HTTPException(
-                status_code=403,
-                detail="You can only create audit logs for your own actions",
-            )
-        if str(audit_log_in.tenant_id) != str(current_user.tenant_id):
-            raise HTTPException(
-                status_code=403,
-                detail="You can only create audit logs for your own tenant",
-            )
+        _check_audit_log_owner(audit_log_in, current_user)
+    else:
+        await run_in_threadpool(_check_audit_log_references, session, audit_log_in)
     
     # Get client IP and user agent
     client_ip = request.client.host if request.client else None
@@ -159,13 +194,58 @@ def create_audit_log(
         audit_log_data["ip_address"] = client_ip
     if not audit_log_data.get("user_agent") and user_agent:
         audit_log_data["user_agent"] = user_agent
+    audit_log_data["id"] = uuid7()
     
-    audit_log = AuditLog.model_validate(audit_log_data)
-    session.add(audit_log)
-    session.commit()
-    session.refresh(audit_log)
+    # audit_log_in is already validated; the native enum columns guard the
+    # rest, so the row is written as-is instead of validating a second time
+    written = False
+    if not sync:
+        if audit_file_sink.enabled:
+            # The sink does blocking file I/O, so keep it off the event loop
+            written = await run_in_threadpool(audit_file_sink.write, audit_log_data)
+        written = written or audit_writer.enqueue(audit_log_data)
+    if not written:
+        await run_in_threadpool(_insert_audit_log, session, audit_log_data)
     
-    return AuditLogPublic.model_validate(audit_log)
+    return AuditLogPublic.model_validate(audit_log_data)
+
+
+@router.post(
+    "/bulk",
+    response_model=AuditLogIds,
+)
+def create_audit_logs_bulk(
+    *,
+    session: SessionDep,
+    request: Request,
+    audit_logs_in: list[AuditLogCreate],
+    current_user: CurrentUser,
+) -> Any:
+    """
+    Create many audit log entries in a single round-trip (authenticated users).
+    """
+    if current_user.role != UserRole.ADMIN:
+        for audit_log_in in audit_logs_in:
+            _check_audit_log_owner(audit_log_in, current_user)
+
+    client_ip = request.client.host if request.client else None
+    user_agent = request.headers.get("user-agent")
+
+    # Unless a client supplied timestamps, let the database stamp the rows
+    exclude = None if any("timestamp" in a.model_fields_set for a in audit_logs_in) else {"timestamp"}
+    rows = []
+    for audit_log_in in audit_logs_in:
+        row = audit_log_in.model_dump(exclude=exclude)
+        row["id"] = uuid7()
+        if not row.get("ip_address") and client_ip:
+            row["ip_address"] = client_ip
+        if not row.get("user_agent") and user_agent:
+            row["user_agent"] = user_agent
+        rows.append(row)
+
+    crud.bulk_create_audit_logs(session=session, rows=rows)
+
+    return AuditLogIds(ids=[row["id"] for row in rows], count=len(rows))
 
 
 @router.get("/{audit_log_id}", response_model=AuditLogPublic)
@@ -177,7 +257,7 @@ def read_audit_log(
     """
     Get a specific audit log by id.
     """
-    audit_log = session.get(AuditLog, audit_log_id)
+    audit_log = crud.get_audit_log_by_id(session=session, audit_log_id=audit_log_id)
     if not audit_log:
         raise HTTPException(
             status_code=404,
@@ -201,7 +281,7 @@ def update_audit_log(
     """
     Update an audit log entry.
     """
-    audit_log = session.get(AuditLog, audit_log_id)
+    audit_log = crud.get_audit_log_by_id(session=session, audit_log_id=audit_log_id)
     if not audit_log:
         raise HTTPException(
             status_code=404,
@@ -212,10 +292,13 @@ def update_audit_log(
     if update_data:
         audit_log.sqlmodel_update(update_data)
         session.add(audit_log)
-        session.commit()
-        session.refresh(audit_log)
     
-    return AuditLogPublic.model_validate(audit_log)
+    # Every field is known client-side; build the response before commit
+    # expires the instance so it doesn't have to be re-selected
+    audit_log_out = AuditLogPublic.model_validate(audit_log)
+    session.commit()
+    
+    return audit_log_out
 
 
 @router.delete(
@@ -231,7 +314,7 @@ def delete_audit_log(
     """
     Delete an audit log entry.
     """
-    audit_log = session.get(AuditLog, audit_log_id)
+    audit_log = crud.get_audit_log_by_id(session=session, audit_log_id=audit_log_id)
     if not audit_log:
         raise HTTPException(
             status_code=404,
@@ -244,13 +327,56 @@ def delete_audit_log(
     return Message(message="Audit log deleted successfully")
 
 
+AUDIT_LOG_CSV_HEADER = [
+    "ID", "Timestamp", "User ID", "Action", "Resource Type", "Resource ID",
+    "IP Address", "User Agent", "Severity", "Tenant ID", "Session ID",
+    "Before State", "After State", "Custom Metadata"
+]
+CSV_EXPORT_BATCH_SIZE = 1000
+
+
+def _audit_log_csv_row(log: AuditLog) -> list[str]:
+    return [
+        str(log.id),
+        log.timestamp.isoformat(),
+        str(log.user_id),
+        log.action,
+        log.resource_type,
+        log.resource_id,
+        log.ip_address or "",
+        log.user_agent or "",
+        log.severity,
+        str(log.tenant_id) if log.tenant_id else "",
+        log.session_id or "",
+        str(log.before_state) if log.before_state else "",
+        str(log.after_state) if log.after_state else "",
+        str(log.custom_metadata) if log.custom_metadata else "",
+    ]
+
+
+def _stream_audit_logs_csv(statement: Any) -> Iterator[str]:
+    # The request session is closed before the body is sent, so the stream
+    # opens its own and reads through a server-side cursor in batches
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(AUDIT_LOG_CSV_HEADER)
+    yield output.getvalue()
+    with get_session(stream_results=True) as session:
+        result = session.exec(statement.execution_options(yield_per=CSV_EXPORT_BATCH_SIZE))
+        for audit_logs in result.partitions():
+            output.seek(0)
+            output.truncate()
+            writer.writerows(_audit_log_csv_row(log) for log in audit_logs)
+            yield output.getvalue()
+
+
 @router.get(
     "/export/csv",
     dependencies=[Depends(get_current_active_superuser)],
-    response_model=AuditLogExport,
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/csv": {}}, "description": "Audit logs as CSV"}},
 )
 def export_audit_logs_csv(
-    session: SessionDep,
     user_id: uuid.UUID | None = Query(None, description="Filter by user ID"),
     action: AuditAction | None = Query(None, description="Filter by action type"),
     resource_type: str | None = Query(None, description="Filter by resource type"),
@@ -259,7 +385,7 @@ def export_audit_logs_csv(
     tenant_id: uuid.UUID | None = Query(None, description="Filter by tenant ID"),
     start_date: datetime | None = Query(None, description="Start date for filtering"),
     end_date: datetime | None = Query(None, description="End date for filtering"),
-) -> Any:
+) -> StreamingResponse:
     """
     Export audit logs to CSV format.
     """
@@ -285,46 +411,15 @@ def export_audit_logs_csv(
     
     statement = statement.order_by(col(AuditLog.timestamp).desc())
     
-    audit_logs = session.exec(statement).all()
-    
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
-        "ID", "Timestamp", "User ID", "Action", "Resource Type", "Resource ID",
-        "IP Address", "User Agent", "Severity", "Tenant ID", "Session ID",
-        "Before State", "After State", "Custom Metadata"
-    ])
-    
-    # Write data
-    for log in audit_logs:
-        writer.writerow([
-            str(log.id),
-            log.timestamp.isoformat(),
-            str(log.user_id),
-            log.action,
-            log.resource_type,
-            log.resource_id,
-            log.ip_address or "",
-            log.user_agent or "",
-            log.severity,
-            str(log.tenant_id) if log.tenant_id else "",
-            log.session_id or "",
-            str(log.before_state) if log.before_state else "",
-            str(log.after_state) if log.after_state else "",
-            str(log.custom_metadata) if log.custom_metadata else "",
-        ])
-    
-    csv_data = output.getvalue()
-    output.close()
-    
     # Generate filename with timestamp
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     filename = f"audit_logs_{timestamp}.csv"
     
-    return AuditLogExport(csv_data=csv_data, filename=filename)
+    return StreamingResponse(
+        _stream_audit_logs_csv(statement),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
 
 
 @router.websocket("/ws")
@@ -367,7 +462,6 @@ def create_audit_log_entry(
     
     # If tenant_id is not provided, get it from the user
     if tenant_id is None:
-        from app.models import User
         user = session.get(User, user_id)
         if user is None:
             raise ValueError(f"User with id {user_id} not found")
@@ -388,8 +482,11 @@ def create_audit_log_entry(
         session_id=session_id,
     )
     
+    # id and timestamp are generated client-side, so nothing needs reading
+    # back; detach before commit so the returned entry isn't expired
     session.add(audit_log)
+    session.flush()
+    session.expunge(audit_log)
     session.commit()
-    session.refresh(audit_log)
     
     return audit_log 
\ No newline at end of file
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic.networks import EmailStr
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.api.deps import get_current_active_superuser
 from app.models import Message
 from app.utils import generate_test_email, send_email
-from app.core.optimization import optimize_database, get_tenant_performance_report
+from app.core.optimization import (
+    apply_audit_log_retention,
+    get_tenant_performance_report,
+    optimize_database,
+)
 from app.core.db import check_db_health, get_db_stats, vacuum_database, reindex_database
 
 router = APIRouter(prefix="/utils", tags=["utils"])
@@ -39,7 +43,7 @@ def check_database_health():
     """Check database health and connectivity."""
     return {
         "healthy": check_db_health(),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 @router.get("/db/stats")
@@ -55,7 +59,7 @@ def optimize_database_endpoint():
         return {
             "message": "Database optimization completed",
             "results": results,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     except Exception as e:
         raise HTTPException(
@@ -63,6 +67,25 @@ def optimize_database_endpoint():
             detail=f"Database optimization failed: {str(e)}"
         )
 
+@router.post(
+    "/db/audit-log-retention",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def audit_log_retention_endpoint():
+    """
+    Permanently delete audit logs older than AUDIT_LOG_RETENTION_MONTHS.
+
+    A no-op while the setting is unset.
+    """
+    results = apply_audit_log_retention()
+    return {
+        "message": "Audit log retention applied"
+        if results["retention_months"] is not None
+        else "Audit log retention is not configured",
+        "results": results,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
 @router.post("/db/vacuum")
 def vacuum_database_endpoint():
     """Run VACUUM on the database."""
@@ -95,7 +118,7 @@ def get_tenant_performance(tenant_id: str):
         return {
             "tenant_id": tenant_id,
             "report": report,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     except Exception as e:
         raise HTTPException(
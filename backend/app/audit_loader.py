@@ -0,0 +1,45 @@
+import logging
+
+import orjson
+from sqlmodel import Session
+
+from app import crud
+from app.core.audit_file_sink import audit_file_sink
+from app.core.db import engine
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def load_completed_files() -> int:
+    """COPY every completed audit JSONL file into audit_log, one file per transaction."""
+    loaded = 0
+    for path in audit_file_sink.completed_files():
+        try:
+            # Stream lines straight into COPY rather than reading the file
+            # into a list first, so memory stays flat however big it is
+            with path.open("rb") as lines, Session(engine) as session:
+                count = crud.bulk_create_audit_logs(
+                    session=session,
+                    rows=(orjson.loads(line) for line in lines if line.strip()),
+                )
+        except Exception as e:
+            # Keep the file for inspection instead of retrying it every run
+            logger.error(f"Failed to load {path.name}: {e}")
+            path.rename(path.with_suffix(".failed"))
+            continue
+        path.unlink()
+        loaded += count
+        logger.debug("Loaded %d audit log entries from %s", count, path.name)
+    return loaded
+
+
+def main() -> None:
+    if not audit_file_sink.enabled:
+        logger.info("Audit file sink is disabled, nothing to load")
+        return
+    logger.info("Loaded %d audit log entries", load_completed_files())
+
+
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,7 @@ max_tries = 60 * 5  # 5 minutes
 wait_seconds = 1
 
 
-@retry(
-    stop=stop_after_attempt(max_tries),
-    wait=wait_fixed(wait_seconds),
-    before=before_log(logger, logging.INFO),
-    after=after_log(logger, logging.WARN),
-)
-def init(db_engine: Engine) -> None:
+def _init_impl(db_engine: Engine) -> None:
     try:
         with Session(db_engine) as session:
             # Try to create session to check if DB is awake
@@ -29,6 +23,14 @@ def init(db_engine: Engine) -> None:
         raise e
 
 
+init = retry(
+    stop=stop_after_attempt(max_tries),
+    wait=wait_fixed(wait_seconds),
+    before=before_log(logger, logging.INFO),
+    after=after_log(logger, logging.WARN),
+)(_init_impl)
+
+
 def main() -> None:
     logger.info("Initializing service")
     init(engine)
@@ -0,0 +1,123 @@
+"""
+Background batching writer for audit log inserts
+"""
+import asyncio
+import logging
+from typing import Any
+
+import orjson
+from sqlmodel import Session
+
+from app import crud
+from app.core.config import settings
+from app.core.db import engine
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAuditWriter:
+    """Queue audit log rows and insert them in batches off the request path."""
+
+    def __init__(self, max_batch: int = 500, flush_interval: float = 1.0, max_queue: int = 50000):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self._queue: asyncio.Queue[dict[str, Any] | None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the flush loop on the running event loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run())
+        logger.info("Audit log writer started")
+
+    async def stop(self) -> None:
+        """Flush everything still queued and stop the flush loop."""
+        if not self.running or asyncio.get_running_loop() is not self._loop:
+            return
+        assert self._queue is not None and self._task is not None
+        await self._queue.put(None)
+        await self._task
+        self._queue = None
+        self._loop = None
+        self._task = None
+        logger.info("Audit log writer stopped")
+
+    def enqueue(self, row: dict[str, Any]) -> bool:
+        """
+        Queue a fully populated audit log row (including ``id``).
+
+        Returns False when the row was not queued (writer not running on this
+        event loop or queue full); the caller should then insert it directly.
+        """
+        if not self.running or self._queue is None:
+            return False
+        try:
+            if asyncio.get_running_loop() is not self._loop:
+                return False
+            self._queue.put_nowait(row)
+        except (RuntimeError, asyncio.QueueFull):
+            return False
+        return True
+
+    async def _run(self) -> None:
+        assert self._queue is not None and self._loop is not None
+        queue = self._queue
+        loop = self._loop
+        closing = False
+        while not closing:
+            row = await queue.get()
+            if row is None:
+                break
+            batch = [row]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    closing = True
+                    break
+                batch.append(row)
+            await loop.run_in_executor(None, self._flush, batch)
+
+    def _flush(self, batch: list[dict[str, Any]]) -> None:
+        """
+        Write a batch; if it fails, bisect it so one bad row (e.g. a foreign
+        key violation) only loses itself. Rows that still fail are logged
+        with their full payload so they can be replayed.
+        """
+        try:
+            with Session(engine) as session:
+                crud.bulk_create_audit_logs(session=session, rows=batch)
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(
+                    "Dropped audit log entry %s: %s",
+                    orjson.dumps(batch[0], default=str).decode(),
+                    e,
+                )
+                return
+            logger.warning(f"Failed to flush {len(batch)} audit log entries, splitting batch: {e}")
+            middle = len(batch) // 2
+            self._flush(batch[:middle])
+            self._flush(batch[middle:])
+
+
+audit_writer = AsyncAuditWriter(
+    max_batch=settings.AUDIT_WRITER_MAX_BATCH,
+    flush_interval=settings.AUDIT_WRITER_FLUSH_INTERVAL_SECONDS,
+    max_queue=settings.AUDIT_WRITER_MAX_QUEUE,
+)
@@ -0,0 +1,93 @@
+"""
+Append-only JSONL sink for audit log rows, loaded into the database out-of-band
+"""
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+FILE_SUFFIX = ".jsonl"
+
+
+class AuditFileSink:
+    """
+    Append audit log rows to per-process JSONL files.
+
+    Each process writes ``audit-<pid>-<period>.jsonl`` with O_APPEND writes,
+    one line per row, and starts a new file every ``rotate_seconds``. Files
+    from earlier periods are complete and safe for app/audit_loader.py to load.
+    """
+
+    def __init__(self, directory: str | None, rotate_seconds: int = 60):
+        self.directory = Path(directory) if directory else None
+        self.rotate_seconds = rotate_seconds
+        self._fd: int | None = None
+        self._period: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def _current_fd(self) -> int:
+        assert self.directory is not None
+        period = int(time.time()) // self.rotate_seconds
+        if period != self._period:
+            if self._fd is not None:
+                os.close(self._fd)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"audit-{os.getpid()}-{period}{FILE_SUFFIX}"
+            self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._period = period
+        assert self._fd is not None
+        return self._fd
+
+    def write(self, row: dict[str, Any]) -> bool:
+        """
+        Append a fully populated audit log row (including ``id``).
+
+        Returns False when the sink is disabled or the write failed; the caller
+        should then insert the row another way.
+        """
+        if not self.enabled:
+            return False
+        line = orjson.dumps(row) + b"\n"
+        try:
+            with self._lock:
+                os.write(self._current_fd(), line)
+        except OSError as e:
+            logger.error(f"Failed to append audit log entry: {e}")
+            return False
+        return True
+
+    def completed_files(self) -> list[Path]:
+        """Files from past rotation periods, oldest first."""
+        if self.directory is None or not self.directory.exists():
+            return []
+        # Skip the previous period too, so a write that raced the rotation has landed
+        last_complete = int(time.time()) // self.rotate_seconds - 2
+        completed = []
+        # scandir yields names straight from the directory listing, without
+        # glob's pattern matching and per-entry Path objects
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("audit-") and entry.name.endswith(FILE_SUFFIX)):
+                    continue
+                period = int(entry.name[: -len(FILE_SUFFIX)].rsplit("-", 1)[1])
+                if period <= last_complete:
+                    completed.append((period, entry.path))
+        return [Path(path) for _, path in sorted(completed)]
+
+
+audit_file_sink = AuditFileSink(
+    settings.AUDIT_FILE_SINK_DIR,
+    rotate_seconds=settings.AUDIT_FILE_SINK_ROTATE_SECONDS,
+)
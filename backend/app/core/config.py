@@ -98,6 +98,45 @@ class Settings(BaseSettings):
     # Database logging
     SQL_ECHO: bool = False
 
+    # Batched background writes for POST /audit-logs/. Off by default: a
+    # queued entry is returned before it is written and is lost if the
+    # process dies or the row fails to insert
+    AUDIT_WRITER_ENABLED: bool = False
+    AUDIT_WRITER_MAX_BATCH: int = 500
+    AUDIT_WRITER_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_WRITER_MAX_QUEUE: int = 50000
+
+    # When set, POST /audit-logs/ appends entries to JSONL files in this
+    # directory and app/audit_loader.py loads them into the database
+    AUDIT_FILE_SINK_DIR: str | None = None
+    AUDIT_FILE_SINK_ROTATE_SECONDS: int = 60
+
+    # Monthly audit_log partitions are created this many months ahead, at
+    # startup and then every AUDIT_LOG_PARTITION_CHECK_INTERVAL_SECONDS
+    AUDIT_LOG_PARTITION_MONTHS_AHEAD: int = 3
+    AUDIT_LOG_PARTITION_CHECK_INTERVAL_SECONDS: int = 6 * 60 * 60
+    # Audit history older than this is destroyed by POST /utils/db/audit-log-retention.
+    # Unset (the default) keeps audit logs forever
+    AUDIT_LOG_RETENTION_MONTHS: int | None = None
+
+    # Initial data seeding (app/initial_data.py)
+    SKIP_SEED: bool = False
+    # Opt-in: touched after a successful seed, and warm restarts skip seeding
+    # while it exists. Point it at a volume that lives exactly as long as the
+    # database, or the FIRST_SUPERUSER resync is skipped for a fresh database
+    SEED_MARKER_PATH: str | None = None
+
+    # Database connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Rows per multi-row INSERT statement for executemany-style inserts
+    DB_INSERT_BATCH_SIZE: int = 1000
+    # Compiled SQL cache entries kept per engine
+    DB_QUERY_CACHE_SIZE: int = 2000
+    # Executions of a statement before psycopg prepares it server-side
+    DB_PREPARE_THRESHOLD: int = 2
+
     def _check_default_secret(self, var_name: str, value: str | None) -> None:
         if value == "changethis":
             message = (
@@ -3,9 +3,11 @@ from sqlalchemy import event, text
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.engine import Engine
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Any, Generator, Optional
 import logging
 
+import orjson
+
 from app import crud
 from app.core.config import settings
 from app.models import User, UserCreate, Tenant, UserRole
@@ -13,18 +15,31 @@ from app.models import User, UserCreate, Tenant, UserRole
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+def _json_dumps(value: Any) -> str:
+    # Non-string keys are stringified, as the stdlib encoder does
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Enhanced engine with connection pooling and optimization
 engine = create_engine(
     str(settings.SQLALCHEMY_DATABASE_URI),
     # Connection pooling configuration
     poolclass=QueuePool,
-    pool_size=20,  # Number of connections to maintain
-    max_overflow=30,  # Additional connections when pool is full
+    pool_size=settings.DB_POOL_SIZE,  # Number of connections to maintain
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Additional connections when pool is full
     pool_pre_ping=True,  # Validate connections before use
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,  # Recycle before server/proxy idle timeouts
     pool_timeout=30,  # Timeout for getting connection from pool
     
     # Performance optimizations
+    # Batch executemany INSERTs (session.add_all, insert(Model) with a list)
+    # into multi-row VALUES statements; psycopg 3 pipelines the rest
+    insertmanyvalues_page_size=settings.DB_INSERT_BATCH_SIZE,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Skip recompiling repeat statement shapes
+    # Encode/decode JSONB columns (audit log states, tenant features) with orjson
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
     echo=settings.SQL_ECHO,  # Log SQL queries in development
     echo_pool=settings.SQL_ECHO,  # Log pool events in development
     
@@ -32,6 +47,8 @@ engine = create_engine(
     connect_args={
         "application_name": "fastapi_app",
         "options": "-c timezone=utc -c statement_timeout=30000",  # 30s timeout
+        # Reuse server-side plans for repeated statements (audit search, get-by-id)
+        "prepare_threshold": settings.DB_PREPARE_THRESHOLD,
     }
 )
 
@@ -45,28 +62,38 @@ def receive_after_cursor_execute(conn, cursor, statement, parameters, context, e
     total = logger.info(f"Total Time: {statement[:50]}...")
 
 # Multi-tenant session management
+# SET cannot take bind parameters; set_config() can, so the statement is cached
+# once instead of being rebuilt (and re-parsed) per tenant id
+SET_TENANT_CONTEXT = text("SELECT set_config('app.tenant_id', :tenant_id, false)")
+
+
 class TenantSession:
     def __init__(self, tenant_id: Optional[str] = None):
         self.tenant_id = tenant_id
     
     def __enter__(self):
-        self.session = Session(engine)
-        if self.tenant_id:
-            # Set tenant context for the session
-            self.session.execute(text(f"SET app.tenant_id = '{self.tenant_id}'"))
+        self._context = get_session(self.tenant_id)
+        self.session = self._context.__enter__()
         return self.session
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.session.close()
+        return self._context.__exit__(exc_type, exc_val, exc_tb)
 
 @contextmanager
-def get_session(tenant_id: Optional[str] = None) -> Generator[Session, None, None]:
-    """Get a database session with optional tenant context."""
+def get_session(tenant_id: Optional[str] = None, **execution_options) -> Generator[Session, None, None]:
+    """
+    Get a database session with optional tenant context.
+
+    Extra keyword arguments are applied as connection execution options,
+    e.g. ``isolation_level="AUTOCOMMIT"`` or ``stream_results=True``.
+    """
     session = Session(engine)
     try:
+        if execution_options:
+            session.connection(execution_options=execution_options)
         if tenant_id:
             # Set tenant context for the session
-            session.execute(text(f"SET app.tenant_id = '{tenant_id}'"))
+            session.execute(SET_TENANT_CONTEXT, {"tenant_id": str(tenant_id)})
         yield session
     except Exception as e:
         session.rollback()
@@ -78,7 +105,7 @@ def get_session(tenant_id: Optional[str] = None) -> Generator[Session, None, Non
 def get_tenant_session(tenant_id: str) -> Session:
     """Get a database session with tenant context."""
     session = Session(engine)
-    session.execute(text(f"SET app.tenant_id = '{tenant_id}'"))
+    session.execute(SET_TENANT_CONTEXT, {"tenant_id": str(tenant_id)})
     return session
 
 # Database initialization with tenant setup
@@ -126,7 +153,7 @@ def init_db(session: Session) -> None:
 def check_db_health() -> bool:
     """Check database connectivity and health."""
     try:
-        with Session(engine) as session:
+        with get_session() as session:
             session.execute(text("SELECT 1"))
             return True
     except Exception as e:
@@ -137,7 +164,7 @@ def check_db_health() -> bool:
 def get_db_stats() -> dict:
     """Get database statistics for monitoring."""
     try:
-        with Session(engine) as session:
+        with get_session() as session:
             # Get connection pool stats
             pool = engine.pool
             stats = {
@@ -166,9 +193,9 @@ def get_db_stats() -> dict:
 def vacuum_database() -> bool:
     """Run VACUUM on the database to reclaim storage."""
     try:
-        with Session(engine) as session:
+        # VACUUM cannot run inside a transaction block
+        with get_session(isolation_level="AUTOCOMMIT") as session:
             session.execute(text("VACUUM ANALYZE"))
-            session.commit()
             logger.info("Database VACUUM completed successfully")
             return True
     except Exception as e:
@@ -178,9 +205,8 @@ def vacuum_database() -> bool:
 def reindex_database() -> bool:
     """Reindex the database for better performance."""
     try:
-        with Session(engine) as session:
+        with get_session(isolation_level="AUTOCOMMIT") as session:
             session.execute(text("REINDEX DATABASE"))
-            session.commit()
             logger.info("Database reindex completed successfully")
             return True
     except Exception as e:
@@ -2,17 +2,37 @@
 Database optimization utilities for multi-tenant schema
 """
 import logging
-from datetime import datetime, timedelta
+import re
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text, create_engine, and_
 from sqlmodel import Session, select, func
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.core.db import engine
+from app.core.config import settings
+from app.core.db import get_session
 from app.models import Tenant, User, Item, AuditLog, TenantMetrics
 
 logger = logging.getLogger(__name__)
 
+RETENTION_DELETE_BATCH_SIZE = 10_000
+PARTITION_NAME_RE = re.compile(r"audit_log_y(?P<year>\d{4})m(?P<month>\d{2})")
+# pg advisory lock key serializing partition DDL across workers and replicas
+PARTITION_LOCK_KEY = 0x617564_6974  # "audit"
+
+
+def _month_start(moment: datetime) -> datetime:
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _partition_name(month: datetime) -> str:
+    return f"audit_log_y{month:%Y}m{month:%m}"
+
 
 class DatabaseOptimizer:
     """Database optimization utilities for multi-tenant applications."""
@@ -20,45 +40,146 @@ class DatabaseOptimizer:
     def __init__(self, session: Session):
         self.session = session
     
-    def create_partitioned_tables(self) -> bool:
-        """Create partitioned tables for audit logs and metrics."""
+    def create_partitioned_tables(self, months_ahead: int | None = None) -> bool:
+        """Create monthly audit_log partitions for this month and the months ahead."""
+        if months_ahead is None:
+            months_ahead = settings.AUDIT_LOG_PARTITION_MONTHS_AHEAD
         try:
-            # Create partitioned audit_log table
-            self.session.execute(text("""
-                CREATE TABLE IF NOT EXISTS audit_log_partitioned (
-                    LIKE audit_log INCLUDING ALL
-                ) PARTITION BY RANGE (timestamp);
-            """))
-            
-            # Create monthly partitions for the last 12 months
-            for i in range(12):
-                start_date = datetime.now() - timedelta(days=30 * i)
-                end_date = start_date + timedelta(days=30)
-                partition_name = f"audit_log_{start_date.strftime('%Y_%m')}"
-                
+            # Held until the commit below; a worker that loses the race skips,
+            # the winner creates the same partitions
+            locked = self.session.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY}
+            ).scalar()
+            if not locked:
+                logger.info("Audit log partitions are being created elsewhere, skipping")
+                self.session.rollback()
+                return True
+            start = _month_start(datetime.now(timezone.utc))
+            for _ in range(months_ahead + 1):
+                end = _add_months(start, 1)
                 self.session.execute(text(f"""
-                    CREATE TABLE IF NOT EXISTS {partition_name} 
-                    PARTITION OF audit_log_partitioned
-                    FOR VALUES FROM ('{start_date.isoformat()}') 
-                    TO ('{end_date.isoformat()}');
+                    CREATE TABLE IF NOT EXISTS {_partition_name(start)}
+                    PARTITION OF audit_log
+                    FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}');
                 """))
-            
-            # Create partitioned tenant_metrics table
-            self.session.execute(text("""
-                CREATE TABLE IF NOT EXISTS tenant_metrics_partitioned (
-                    LIKE tenant_metrics INCLUDING ALL
-                ) PARTITION BY RANGE (date);
-            """))
+                start = end
             
             self.session.commit()
-            logger.info("Partitioned tables created successfully")
+            logger.info("Audit log partitions created successfully")
             return True
             
         except SQLAlchemyError as e:
-            logger.error(f"Failed to create partitioned tables: {e}")
+            logger.error(f"Failed to create audit log partitions: {e}")
             self.session.rollback()
             return False
     
+    def default_partition_is_empty(self) -> bool:
+        """
+        Check that no rows have fallen through to audit_log_default.
+
+        Rows there mean a month had no partition when they were written, and
+        Postgres refuses to create that month's partition until they are
+        moved out, so this is logged as an error.
+        """
+        try:
+            has_rows = self.session.execute(
+                text("SELECT EXISTS (SELECT 1 FROM audit_log_default)")
+            ).scalar()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to check the default audit log partition: {e}")
+            self.session.rollback()
+            return False
+        if has_rows:
+            logger.error(
+                "audit_log_default holds rows; create the missing monthly "
+                "partitions after moving those rows out of it"
+            )
+        return not has_rows
+    
+    def drop_expired_partitions(self, retention_months: int | None = None) -> list[str]:
+        """
+        Drop audit_log partitions that end before the retention window.
+
+        Does nothing unless a retention window is passed or configured.
+        """
+        if retention_months is None:
+            retention_months = settings.AUDIT_LOG_RETENTION_MONTHS
+        if retention_months is None:
+            return []
+        cutoff = _add_months(_month_start(datetime.now(timezone.utc)), -retention_months)
+        dropped: list[str] = []
+        try:
+            partitions = self.session.execute(text("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = 'audit_log'
+            """)).scalars().all()
+            
+            for name in sorted(partitions):
+                match = PARTITION_NAME_RE.fullmatch(name)
+                if not match:
+                    continue  # audit_log_default
+                month = datetime(int(match["year"]), int(match["month"]), 1, tzinfo=timezone.utc)
+                if _add_months(month, 1) <= cutoff:
+                    # Dropping a whole partition replaces a large DELETE + VACUUM
+                    self.session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                    dropped.append(name)
+            
+            self.session.commit()
+            logger.info(f"Dropped {len(dropped)} expired audit log partitions")
+            return dropped
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to drop expired audit log partitions: {e}")
+            self.session.rollback()
+            return []
+    
+    def delete_expired_audit_logs(
+        self, retention_months: int | None = None, batch_size: int = RETENTION_DELETE_BATCH_SIZE
+    ) -> int:
+        """
+        Delete audit logs older than the retention window in small batches.
+
+        Does nothing unless a retention window is passed or configured.
+        """
+        if retention_months is None:
+            retention_months = settings.AUDIT_LOG_RETENTION_MONTHS
+        if retention_months is None:
+            return 0
+        cutoff = _add_months(_month_start(datetime.now(timezone.utc)), -retention_months)
+        deleted = 0
+        try:
+            # Whole expired months go with drop_expired_partitions; this catches
+            # stragglers (e.g. in audit_log_default). Batches keep each transaction
+            # short so concurrent writers and autovacuum keep up. ctid is not
+            # unique across partitions, so match on the primary key instead.
+            while True:
+                result = self.session.execute(
+                    text("""
+                        DELETE FROM audit_log
+                        WHERE (id, timestamp) IN (
+                            SELECT id, timestamp FROM audit_log
+                            WHERE timestamp < :cutoff
+                            LIMIT :batch_size
+                        )
+                    """),
+                    {"cutoff": cutoff, "batch_size": batch_size},
+                )
+                self.session.commit()
+                deleted += result.rowcount
+                if result.rowcount < batch_size:
+                    break
+            
+            logger.info(f"Deleted {deleted} expired audit logs")
+            return deleted
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to delete expired audit logs: {e}")
+            self.session.rollback()
+            return deleted
+    
     def create_tenant_based_indexes(self) -> bool:
         """Create tenant-specific indexes for better performance."""
         try:
@@ -178,7 +299,7 @@ class DatabaseOptimizer:
                 ORDER BY tablename, attname;
             """))
             
-            stats['column_stats'] = [dict(row) for row in result]
+            stats['column_stats'] = [dict(row._mapping) for row in result]
             
             # Get index usage statistics
             result = self.session.execute(text("""
@@ -193,7 +314,7 @@ class DatabaseOptimizer:
                 ORDER BY idx_scan DESC;
             """))
             
-            stats['index_usage'] = [dict(row) for row in result]
+            stats['index_usage'] = [dict(row._mapping) for row in result]
             
             # Get table sizes
             result = self.session.execute(text("""
@@ -206,7 +327,7 @@ class DatabaseOptimizer:
                 ORDER BY pg_total_relation_size(tablename::text) DESC;
             """))
             
-            stats['table_sizes'] = [dict(row) for row in result]
+            stats['table_sizes'] = [dict(row._mapping) for row in result]
             
             return stats
             
@@ -236,7 +357,7 @@ class DatabaseOptimizer:
             recent_audits = self.session.exec(
                 select(func.count())
                 .where(AuditLog.tenant_id == tenant_id)
-                .where(AuditLog.timestamp > datetime.now() - timedelta(days=7))
+                .where(AuditLog.timestamp > datetime.now(timezone.utc) - timedelta(days=7))
             ).one()
             tenant_stats['recent_audits'] = recent_audits
             
@@ -253,40 +374,47 @@ class DatabaseOptimizer:
     def create_tenant_metrics(self) -> bool:
         """Create or update tenant metrics for monitoring."""
         try:
-            tenants = self.session.exec(select(Tenant)).all()
-            
-            for tenant in tenants:
-                # Calculate metrics
-                user_count = self.session.exec(
-                    select(func.count()).where(User.tenant_id == tenant.id)
-                ).one()
-                
-                item_count = self.session.exec(
-                    select(func.count()).where(Item.tenant_id == tenant.id)
-                ).one()
-                
-                audit_count = self.session.exec(
-                    select(func.count()).where(AuditLog.tenant_id == tenant.id)
-                ).one()
-                
-                active_users = self.session.exec(
-                    select(func.count())
-                    .where(User.tenant_id == tenant.id)
-                    .where(User.is_active == True)
-                    .where(User.last_login_at > datetime.now() - timedelta(days=30))  # type: ignore
-                ).one()
+            now = datetime.now(timezone.utc)
+            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            # One grouped count per table instead of four counts per tenant
+            user_counts = dict(self.session.exec(
+                select(User.tenant_id, func.count()).group_by(User.tenant_id)
+            ).all())
+            item_counts = dict(self.session.exec(
+                select(Item.tenant_id, func.count()).group_by(Item.tenant_id)
+            ).all())
+            audit_counts = dict(self.session.exec(
+                select(AuditLog.tenant_id, func.count()).group_by(AuditLog.tenant_id)
+            ).all())
+            active_user_counts = dict(self.session.exec(
+                select(User.tenant_id, func.count())
+                .where(User.is_active == True)
+                .where(User.last_login_at > now - timedelta(days=30))  # type: ignore
+                .group_by(User.tenant_id)
+            ).all())
+            todays_metrics = {
+                metrics.tenant_id: metrics
+                for metrics in self.session.exec(
+                    select(TenantMetrics)
+                    .where(TenantMetrics.date >= today)
+                    .where(TenantMetrics.date < today + timedelta(days=1))
+                ).all()
+            }
+            tenant_ids = self.session.exec(select(Tenant.id)).all()
+            
+            for tenant_id in tenant_ids:
+                user_count = user_counts.get(tenant_id, 0)
+                item_count = item_counts.get(tenant_id, 0)
+                audit_count = audit_counts.get(tenant_id, 0)
+                active_users = active_user_counts.get(tenant_id, 0)
                 
                 # Create or update metrics
-                metrics = self.session.exec(
-                    select(TenantMetrics)
-                    .where(TenantMetrics.tenant_id == tenant.id)
-                    .where(TenantMetrics.date == datetime.now().date())
-                ).first()
+                metrics = todays_metrics.get(tenant_id)
                 
                 if not metrics:
                     metrics = TenantMetrics(
-                        tenant_id=tenant.id,
-                        date=datetime.now(),
+                        tenant_id=tenant_id,
+                        date=now,
                         user_count=user_count,
                         item_count=item_count,
                         audit_log_count=audit_count,
@@ -313,7 +441,7 @@ class DatabaseOptimizer:
 
 def optimize_database() -> Dict[str, Any]:
     """Main function to optimize the entire database."""
-    with Session(engine) as session:
+    with get_session() as session:
         optimizer = DatabaseOptimizer(session)
         
         results = {
@@ -329,8 +457,35 @@ def optimize_database() -> Dict[str, Any]:
         return results
 
 
+def apply_audit_log_retention() -> dict[str, Any]:
+    """
+    Destroy audit history older than AUDIT_LOG_RETENTION_MONTHS.
+
+    Kept out of optimize_database() on purpose: it is irreversible and only
+    runs when called explicitly, and does nothing while retention is unset.
+    """
+    with get_session() as session:
+        optimizer = DatabaseOptimizer(session)
+        return {
+            "retention_months": settings.AUDIT_LOG_RETENTION_MONTHS,
+            "dropped_partitions": optimizer.drop_expired_partitions(),
+            "deleted_audit_logs": optimizer.delete_expired_audit_logs(),
+        }
+
+
+def ensure_audit_log_partitions() -> bool:
+    """
+    Make sure audit_log has partitions for the current and upcoming months and
+    that nothing has landed in the default partition.
+    """
+    with get_session() as session:
+        optimizer = DatabaseOptimizer(session)
+        created = optimizer.create_partitioned_tables()
+        return optimizer.default_partition_is_empty() and created
+
+
 def get_tenant_performance_report(tenant_id: str) -> Dict[str, Any]:
     """Get performance report for a specific tenant."""
-    with Session(engine) as session:
+    with get_session() as session:
         optimizer = DatabaseOptimizer(session)
         return optimizer.optimize_tenant_queries(tenant_id) 
\ No newline at end of file
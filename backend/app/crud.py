@@ -1,7 +1,12 @@
 import uuid
 import logging
+from collections.abc import Iterable
+from enum import Enum
+from itertools import chain
 from typing import Any
 
+from psycopg.types.json import Jsonb
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
 from app.core.security import get_password_hash, verify_password
@@ -21,6 +26,13 @@ from app.models import (
 
 logger = logging.getLogger(__name__)
 
+# Tenants are looked up by code on most tenant-aware paths. Remember each
+# code's id so the lookup becomes a primary-key get, which the session's
+# identity map can answer without a query. The row itself is always read
+# through the session, so a stale entry only costs the query by code.
+_tenant_ids_by_code: dict[str, uuid.UUID] = {}
+
+
 def create_user(*, session: Session, user_create: UserCreate) -> User:
     db_obj = User.model_validate(
         user_create, update={"hashed_password": get_password_hash(user_create.password)}
@@ -71,45 +83,67 @@ def create_item(*, session: Session, item_in: ItemCreate, owner_id: uuid.UUID, t
     return db_item
 
 
+def _tenant_created_audit_log(db_tenant: Tenant, user_id: uuid.UUID) -> AuditLog:
+    return AuditLog(
+        user_id=user_id,
+        action=AuditAction.CREATE,
+        resource_type="tenant",
+        resource_id=str(db_tenant.id),
+        after_state={
+            "id": str(db_tenant.id),
+            "name": db_tenant.name,
+            "description": db_tenant.description,
+            "code": db_tenant.code,
+            "status": db_tenant.status,
+            "max_users": db_tenant.max_users,
+            "max_storage_gb": db_tenant.max_storage_gb,
+            "features_enabled": db_tenant.features_enabled,
+            "created_at": db_tenant.created_at.isoformat(),
+            "updated_at": db_tenant.updated_at.isoformat()
+        },
+        metadata={
+            "tenant_name": db_tenant.name,
+            "tenant_code": db_tenant.code,
+            "creator_user_id": str(user_id)
+        },
+        severity=AuditSeverity.INFO,
+        tenant_id=db_tenant.id
+    )
+
+
 def create_tenant(*, session: Session, tenant_create: TenantCreate, user_id: uuid.UUID | None = None) -> Tenant:
     db_tenant = Tenant.model_validate(tenant_create)
     session.add(db_tenant)
-    session.commit()
-    session.refresh(db_tenant)
     
-    # Create audit log for tenant creation if user_id is provided
+    # Create audit log for tenant creation if user_id is provided. Its state
+    # comes from client-side values, so it can share the tenant's commit
+    # instead of needing a refresh first
     if user_id:
-        audit_log = AuditLog(
-            user_id=user_id,
-            action=AuditAction.CREATE,
-            resource_type="tenant",
-            resource_id=str(db_tenant.id),
-            after_state={
-                "id": str(db_tenant.id),
-                "name": db_tenant.name,
-                "description": db_tenant.description,
-                "code": db_tenant.code,
-                "status": db_tenant.status,
-                "max_users": db_tenant.max_users,
-                "max_storage_gb": db_tenant.max_storage_gb,
-                "features_enabled": db_tenant.features_enabled,
-                "created_at": db_tenant.created_at.isoformat(),
-                "updated_at": db_tenant.updated_at.isoformat()
-            },
-            metadata={
-                "tenant_name": db_tenant.name,
-                "tenant_code": db_tenant.code,
-                "creator_user_id": str(user_id)
-            },
-            severity=AuditSeverity.INFO,
-            tenant_id=db_tenant.id
-        )
-        session.add(audit_log)
-        session.commit()
+        session.add(_tenant_created_audit_log(db_tenant, user_id))
+    session.commit()
+    session.refresh(db_tenant)
     
     return db_tenant
 
 
+def create_tenants(
+    *, session: Session, tenant_creates: list[TenantCreate], user_id: uuid.UUID | None = None
+) -> list[Tenant]:
+    """
+    Create several tenants (and their creation audit logs) in one transaction.
+
+    The flush batches the rows into multi-row INSERTs, so this costs a couple
+    of round-trips and one commit however many tenants are passed.
+    """
+    db_tenants = [Tenant.model_validate(tenant_create) for tenant_create in tenant_creates]
+    session.add_all(db_tenants)
+    if user_id:
+        # Every column the audit log needs is set client-side, so no flush first
+        session.add_all([_tenant_created_audit_log(db_tenant, user_id) for db_tenant in db_tenants])
+    session.commit()
+    return db_tenants
+
+
 def update_tenant(*, session: Session, db_tenant: Tenant, tenant_in: TenantUpdate, user_id: uuid.UUID | None = None) -> Tenant:
     # Store before state for audit log
     before_state = {
@@ -132,10 +166,9 @@ def update_tenant(*, session: Session, db_tenant: Tenant, tenant_in: TenantUpdat
         update_data["updated_at"] = datetime.now(timezone.utc)
         db_tenant.sqlmodel_update(update_data)
         session.add(db_tenant)
-        session.commit()
-        session.refresh(db_tenant)
         
-        # Create audit log for tenant update if user_id is provided
+        # Create audit log for tenant update if user_id is provided, from the
+        # in-memory values so it commits together with the update
         if user_id:
             audit_log = AuditLog(
                 user_id=user_id,
@@ -165,7 +198,8 @@ def update_tenant(*, session: Session, db_tenant: Tenant, tenant_in: TenantUpdat
                 tenant_id=db_tenant.id
             )
             session.add(audit_log)
-            session.commit()
+        session.commit()
+        session.refresh(db_tenant)
     
     return db_tenant
 
@@ -213,9 +247,69 @@ def delete_tenant(*, session: Session, db_tenant: Tenant, user_id: uuid.UUID | N
 
 
 def get_tenant_by_code(*, session: Session, code: str) -> Tenant | None:
+    tenant_id = _tenant_ids_by_code.get(code)
+    tenant = session.get(Tenant, tenant_id) if tenant_id else None
+    if tenant and tenant.code == code:
+        return tenant
     statement = select(Tenant).where(Tenant.code == code)
-    return session.exec(statement).first()
+    tenant = session.exec(statement).first()
+    if tenant:
+        _tenant_ids_by_code[code] = tenant.id
+    return tenant
 
 
 def get_tenant_by_id(*, session: Session, tenant_id: uuid.UUID) -> Tenant | None:
     return session.get(Tenant, tenant_id)
+
+
+def get_audit_log_by_id(*, session: Session, audit_log_id: uuid.UUID) -> AuditLog | None:
+    # The primary key is (id, timestamp), so look up by id alone with a query
+    statement = select(AuditLog).where(AuditLog.id == audit_log_id)
+    return session.exec(statement).first()
+
+
+AUDIT_LOG_COPY_COLUMNS = (
+    "id", "user_id", "action", "resource_type", "resource_id", "ip_address",
+    "user_agent", "before_state", "after_state", "custom_metadata", "severity",
+    "tenant_id", "timestamp", "session_id",
+)
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return Jsonb(value)
+    if isinstance(value, Enum):
+        # Database enum labels are the member names
+        return value.name
+    return value
+
+
+def bulk_create_audit_logs(*, session: Session, rows: Iterable[dict[str, Any]]) -> int:
+    """
+    Write audit log rows (``id`` included) in one round-trip and return how
+    many were written.
+
+    Uses COPY FROM STDIN on PostgreSQL and a multi-row INSERT elsewhere.
+    All rows must carry the same keys; a column left out of them entirely
+    (e.g. ``timestamp``) is filled by its server default. ``rows`` may be a
+    generator: COPY consumes it one row at a time.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+    count = 0
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        columns = [column for column in AUDIT_LOG_COPY_COLUMNS if column in first]
+        with connection.connection.cursor() as cursor:
+            with cursor.copy(f"COPY audit_log ({', '.join(columns)}) FROM STDIN") as copy:
+                for row in chain([first], rows):
+                    copy.write_row([_copy_value(row.get(column)) for column in columns])
+                    count += 1
+    else:
+        batch = [first, *rows]
+        session.execute(insert(AuditLog), batch)
+        count = len(batch)
+    session.commit()
+    return count
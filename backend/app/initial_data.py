@@ -1,18 +1,22 @@
 import logging
+from pathlib import Path
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.core.db import engine, init_db
 from app.core.config import settings
+from app.core.security import get_password_hash
 from app import crud
-from app.models import TenantCreate, UserCreate, User, UserRole
+from app.models import Tenant, TenantCreate, UserCreate, User, UserRole
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 def init() -> None:
-    with Session(engine) as session:
+    # Seed objects are only read back after their commits, never changed
+    # elsewhere meanwhile, so keep them loaded instead of re-selecting each
+    with Session(engine, expire_on_commit=False) as session:
         # Create or get default tenant for superuser
         default_tenant_code = "DEFAULT"
         default_tenant = crud.get_tenant_by_code(session=session, code=default_tenant_code)
@@ -27,7 +31,7 @@ def init() -> None:
                 ),
                 user_id=None  # No user_id for initial data creation
             )
-            logger.info(f"Created default tenant: {default_tenant.name}")
+            logger.debug("Created default tenant: %s", default_tenant.name)
         # Always ensure default_tenant is set
         assert default_tenant is not None, "Default tenant must exist before creating superuser"
 
@@ -39,7 +43,7 @@ def init() -> None:
             # Remove existing superuser to recreate it
             session.delete(user)
             session.commit()
-            logger.info(f"Removed existing superuser: {settings.FIRST_SUPERUSER}")
+            logger.debug("Removed existing superuser: %s", settings.FIRST_SUPERUSER)
         
         user_in = UserCreate(
             email=settings.FIRST_SUPERUSER,
@@ -48,7 +52,7 @@ def init() -> None:
             tenant_id=default_tenant.id
         )
         user = crud.create_user(session=session, user_create=user_in)
-        logger.info(f"Created superuser: {user.email}")
+        logger.debug("Created superuser: %s", user.email)
         
         # Create or update admin@example.com user
         admin_user = session.exec(
@@ -59,7 +63,7 @@ def init() -> None:
             admin_user.role = UserRole.ADMIN
             session.add(admin_user)
             session.commit()
-            logger.info(f"Updated existing admin user: {admin_user.email}")
+            logger.debug("Updated existing admin user: %s", admin_user.email)
         else:
             # Create new admin user
             admin_user_in = UserCreate(
@@ -70,7 +74,7 @@ def init() -> None:
                 full_name="System Administrator"
             )
             admin_user = crud.create_user(session=session, user_create=admin_user_in)
-            logger.info(f"Created admin user: {admin_user.email}")
+            logger.debug("Created admin user: %s", admin_user.email)
         
         # Call the original init_db function
         init_db(session)
@@ -78,48 +82,53 @@ def init() -> None:
         # Create sample tenants
         logger.info("Creating sample tenants")
         
-        # Check if tenants already exist
-        tenant1 = crud.get_tenant_by_code(session=session, code="ACME")
-        if not tenant1:
-            tenant1 = crud.create_tenant(
-                session=session,
-                tenant_create=TenantCreate(
-                    name="Acme Corporation",
-                    description="A leading technology company",
-                    code="ACME",
-                    status="active"
-                ),
-                user_id=admin_user.id if admin_user else None
-            )
-            logger.info(f"Created tenant: {tenant1.name}")
-        
-        tenant2 = crud.get_tenant_by_code(session=session, code="TECHCO")
-        if not tenant2:
-            tenant2 = crud.create_tenant(
-                session=session,
-                tenant_create=TenantCreate(
-                    name="TechCo Solutions",
-                    description="Innovative software solutions provider",
-                    code="TECHCO",
-                    status="active"
-                ),
-                user_id=admin_user.id if admin_user else None
-            )
-            logger.info(f"Created tenant: {tenant2.name}")
-        
-        tenant3 = crud.get_tenant_by_code(session=session, code="STARTUP")
-        if not tenant3:
-            tenant3 = crud.create_tenant(
-                session=session,
-                tenant_create=TenantCreate(
-                    name="Startup Inc",
-                    description="A fast-growing startup company",
-                    code="STARTUP",
-                    status="active"
-                ),
-                user_id=admin_user.id if admin_user else None
-            )
-            logger.info(f"Created tenant: {tenant3.name}")
+        sample_tenants = [
+            TenantCreate(
+                name="Acme Corporation",
+                description="A leading technology company",
+                code="ACME",
+                status="active"
+            ),
+            TenantCreate(
+                name="TechCo Solutions",
+                description="Innovative software solutions provider",
+                code="TECHCO",
+                status="active"
+            ),
+            TenantCreate(
+                name="Startup Inc",
+                description="A fast-growing startup company",
+                code="STARTUP",
+                status="active"
+            ),
+        ]
+        # Look up all sample codes at once and insert the missing tenants in
+        # one batch instead of a query plus two commits per tenant
+        existing_tenants = {
+            tenant.code: tenant
+            for tenant in session.exec(
+                select(Tenant).where(
+                    col(Tenant.code).in_([tenant_in.code for tenant_in in sample_tenants])
+                )
+            ).all()
+        }
+        pending_tenants = [
+            tenant_in for tenant_in in sample_tenants if tenant_in.code not in existing_tenants
+        ]
+        new_tenants = crud.create_tenants(
+            session=session,
+            tenant_creates=pending_tenants,
+            user_id=admin_user.id if admin_user else None
+        )
+        for tenant_in in pending_tenants:
+            logger.debug("Created tenant: %s", tenant_in.name)
+        created_tenants = len(new_tenants)
+        tenants_by_code = existing_tenants | {
+            tenant_in.code: tenant for tenant_in, tenant in zip(pending_tenants, new_tenants, strict=True)
+        }
+        tenant1 = tenants_by_code["ACME"]
+        tenant2 = tenants_by_code["TECHCO"]
+        tenant3 = tenants_by_code["STARTUP"]
         
         # Create sample users
         logger.info("Creating sample users")
@@ -164,17 +173,44 @@ def init() -> None:
             }
         ]
         
-        for user_data in users_data:
-            existing_user = session.exec(
-                select(User).where(User.email == user_data["email"])
-            ).first()
-            if not existing_user:
-                user_in = UserCreate(**user_data)
-                user = crud.create_user(session=session, user_create=user_in)
-                logger.info(f"Created user: {user.full_name}")
+        # Seed data is trusted, so build User rows directly instead of
+        # validating each through UserCreate, and hash each password once
+        existing_emails = set(
+            session.exec(
+                select(User.email).where(
+                    col(User.email).in_([user_data["email"] for user_data in users_data])
+                )
+            ).all()
+        )
+        pending_users = [
+            user_data for user_data in users_data if user_data["email"] not in existing_emails
+        ]
+        # Sample users share a password, so this is usually a single bcrypt hash
+        hashed_passwords = {
+            password: get_password_hash(password)
+            for password in {user_data["password"] for user_data in pending_users}
+        }
+        new_users = []
+        for user_data in pending_users:
+            password = user_data.pop("password")
+            new_users.append(User(**user_data, hashed_password=hashed_passwords[password]))
+            logger.debug("Created user: %s", user_data["full_name"])
+        session.add_all(new_users)
+        session.commit()
+        logger.info("Seeded %d tenants, %d users", created_tenants, len(new_users))
         
         logger.info("Initial data created")
 
 
-if __name__ == "__main__":
+def main() -> None:
+    seed_marker = Path(settings.SEED_MARKER_PATH) if settings.SEED_MARKER_PATH else None
+    if settings.SKIP_SEED or (seed_marker and seed_marker.exists()):
+        logger.info("Initial data already seeded, skipping")
+        return
     init()
+    if seed_marker:
+        seed_marker.touch()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,21 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import sentry_sdk
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.core.async_audit import audit_writer
 from app.core.config import settings
+from app.core.optimization import ensure_audit_log_partitions
+
+logger = logging.getLogger(__name__)
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -14,10 +25,34 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+async def maintain_audit_log_partitions() -> None:
+    # Long-running processes must keep creating next months' partitions, or
+    # new rows start landing in audit_log_default
+    while True:
+        await asyncio.sleep(settings.AUDIT_LOG_PARTITION_CHECK_INTERVAL_SECONDS)
+        try:
+            await run_in_threadpool(ensure_audit_log_partitions)
+        except Exception:
+            logger.exception("Audit log partition maintenance failed")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    await run_in_threadpool(ensure_audit_log_partitions)
+    partition_task = asyncio.create_task(maintain_audit_log_partitions())
+    if settings.AUDIT_WRITER_ENABLED:
+        await audit_writer.start()
+    yield
+    partition_task.cancel()
+    await audit_writer.stop()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Set all CORS enabled origins
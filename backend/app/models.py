@@ -1,10 +1,25 @@
+import os
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Optional, List
 from pydantic import EmailStr
-from sqlmodel import Field, Relationship, SQLModel, JSON, Index
+from sqlmodel import Field, Relationship, SQLModel, Index
 from enum import Enum
-from sqlalchemy import text
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary keys
+    land on the right edge of the B-tree instead of scattering across it.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
 
 
 class UserRole(str, Enum):
@@ -35,7 +50,7 @@ class AuditSeverity(str, Enum):
 
 # Base class for all tenant-aware models
 class TenantAwareBase(SQLModel):
-    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False, index=True)
+    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False)
 
 
 # Tenant model with enhanced features
@@ -47,10 +62,20 @@ class TenantBase(SQLModel):
     # Multi-tenant configuration
     max_users: int = Field(default=100)
     max_storage_gb: int = Field(default=10)
-    features_enabled: dict = Field(default_factory=dict, sa_type=JSON)
+    features_enabled: dict = Field(default_factory=dict, sa_type=JSONB)
     # Performance tracking
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        index=True,
+        sa_column_kwargs={"server_default": func.timezone("utc", func.now())},
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={
+            "server_default": func.timezone("utc", func.now()),
+            "onupdate": func.timezone("utc", func.now()),
+        },
+    )
 
 
 class TenantCreate(TenantBase):
@@ -70,7 +95,7 @@ class TenantUpdate(SQLModel):
 class Tenant(TenantBase, table=True):  # type: ignore
     __tablename__ = "tenant" # type: ignore
     
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     
     # Relationships
     users: List["User"] = Relationship(back_populates="tenant", cascade_delete=True)
@@ -96,11 +121,11 @@ class TenantsPublic(SQLModel):
 # Enhanced User model with tenant isolation
 class UserBase(SQLModel):
     email: EmailStr = Field(max_length=255)
-    is_active: bool = Field(default=True, index=True)
-    full_name: str | None = Field(default=None, max_length=255, index=True)
-    role: UserRole = Field(default=UserRole.USER, index=True)
+    is_active: bool = Field(default=True)
+    full_name: str | None = Field(default=None, max_length=255)
+    role: UserRole = Field(default=UserRole.USER)
     # Performance tracking
-    last_login_at: datetime | None = Field(default=None, index=True)
+    last_login_at: datetime | None = Field(default=None)
     login_count: int = Field(default=0)
 
 
@@ -137,9 +162,9 @@ class UpdatePassword(SQLModel):
 class User(UserBase, table=True):  # type: ignore
     __tablename__ = "user" # type: ignore
     
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     hashed_password: str
-    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False, index=True)
+    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False)
     
     # Relationships
     tenant: Tenant = Relationship(back_populates="users")
@@ -148,7 +173,7 @@ class User(UserBase, table=True):  # type: ignore
     
     # Indexes for performance
     __table_args__ = (
-        Index("idx_user_tenant_email", "tenant_id", "email"),
+        Index("idx_user_email_tenant", "email", "tenant_id"),
         Index("idx_user_tenant_active", "tenant_id", "is_active"),
         Index("idx_user_tenant_role", "tenant_id", "role"),
         Index("idx_user_last_login", "last_login_at"),
@@ -167,11 +192,20 @@ class UsersPublic(SQLModel):
 
 # Enhanced Item model with tenant isolation
 class ItemBase(SQLModel):
-    title: str = Field(min_length=1, max_length=255, index=True)
+    title: str = Field(min_length=1, max_length=255)
     description: str | None = Field(default=None, max_length=1000)
     # Performance tracking
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"server_default": func.timezone("utc", func.now())},
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={
+            "server_default": func.timezone("utc", func.now()),
+            "onupdate": func.timezone("utc", func.now()),
+        },
+    )
 
 
 class ItemCreate(ItemBase):
@@ -186,9 +220,9 @@ class ItemUpdate(ItemBase):
 class Item(ItemBase, table=True):  # type: ignore
     __tablename__ = "item" # type: ignore
     
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
     owner_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, index=True)
-    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False, index=True)
+    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False)
     
     # Relationships
     owner: User = Relationship(back_populates="items")
@@ -215,20 +249,20 @@ class ItemsPublic(SQLModel):
 
 # Enhanced Audit Log model with tenant isolation and partitioning support
 class AuditLogBase(SQLModel):
-    user_id: uuid.UUID = Field(foreign_key="user.id", nullable=False, index=True)
-    action: AuditAction = Field(index=True)
-    resource_type: str = Field(max_length=100, index=True)
-    resource_id: str = Field(max_length=255, index=True)
-    ip_address: str | None = Field(default=None, max_length=45, index=True)
+    user_id: uuid.UUID = Field(foreign_key="user.id", nullable=False)
+    action: AuditAction
+    resource_type: str = Field(max_length=100)
+    resource_id: str = Field(max_length=255)
+    ip_address: str | None = Field(default=None, max_length=45)
     user_agent: str | None = Field(default=None, max_length=500)
-    before_state: dict | None = Field(default=None, sa_type=JSON)
-    after_state: dict | None = Field(default=None, sa_type=JSON)
-    custom_metadata: dict | None = Field(default=None, sa_type=JSON)
-    severity: AuditSeverity = Field(default=AuditSeverity.INFO, index=True)
-    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False, index=True)
+    before_state: dict | None = Field(default=None, sa_type=JSONB)
+    after_state: dict | None = Field(default=None, sa_type=JSONB)
+    custom_metadata: dict | None = Field(default=None, sa_type=JSONB)
+    severity: AuditSeverity = Field(default=AuditSeverity.INFO)
+    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False)
     # Performance tracking
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
-    session_id: str | None = Field(default=None, max_length=255, index=True)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    session_id: str | None = Field(default=None, max_length=255)
 
 
 class AuditLogCreate(AuditLogBase):
@@ -243,7 +277,13 @@ class AuditLogUpdate(SQLModel):
 class AuditLog(AuditLogBase, table=True):  # type: ignore
     __tablename__ = "audit_log" # type: ignore
     
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
+    # Partitioned by month on timestamp, so the partition key is part of the PK
+    timestamp: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        primary_key=True,
+        sa_column_kwargs={"server_default": func.timezone("utc", func.now())},
+    )
     
     # Relationships
     user: User = Relationship(back_populates="audit_logs")
@@ -254,12 +294,23 @@ class AuditLog(AuditLogBase, table=True):  # type: ignore
         # Composite indexes for common queries
         Index("idx_audit_tenant_timestamp", "tenant_id", "timestamp"),
         Index("idx_audit_tenant_action", "tenant_id", "action"),
-        Index("idx_audit_tenant_severity", "tenant_id", "severity"),
-        Index("idx_audit_tenant_user", "tenant_id", "user_id"),
-        Index("idx_audit_tenant_resource", "tenant_id", "resource_type", "resource_id"),
-        # Time-based indexes for partitioning
+        # Alerting reads only high-severity rows; index just those
+        Index(
+            "idx_audit_tenant_severity_hot",
+            "tenant_id",
+            "timestamp",
+            postgresql_where=text("severity IN ('ERROR', 'CRITICAL')"),
+        ),
+        # Lead with the selective column; these also serve unscoped lookups
+        Index("idx_audit_user_tenant", "user_id", "tenant_id"),
+        # Per-user history, newest first (GET /audit-logs/?user_id=...)
+        Index("idx_audit_user_timestamp", "user_id", "timestamp"),
+        Index("idx_audit_resource_tenant", "resource_id", "resource_type", "tenant_id"),
+        # Global time ordering for unscoped (admin) listings
         Index("idx_audit_timestamp_partition", "timestamp"),
-        Index("idx_audit_tenant_timestamp_partition", "tenant_id", "timestamp"),
+        # GIN index for metadata key/containment lookups
+        Index("idx_audit_metadata_gin", "custom_metadata", postgresql_using="gin"),
+        {"postgresql_partition_by": 'RANGE ("timestamp")'},
     )
 
 
@@ -272,9 +323,9 @@ class AuditLogsPublic(SQLModel):
     count: int
 
 
-class AuditLogExport(SQLModel):
-    csv_data: str
-    filename: str
+class AuditLogIds(SQLModel):
+    ids: list[uuid.UUID]
+    count: int
 
 
 # Generic message
@@ -302,9 +353,13 @@ class NewPassword(SQLModel):
 class TenantMetrics(SQLModel, table=True):  # type: ignore
     __tablename__ = "tenant_metrics" # type: ignore
     
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False, index=True)
-    date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
+    tenant_id: uuid.UUID = Field(foreign_key="tenant.id", nullable=False)
+    date: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        index=True,
+        sa_column_kwargs={"server_default": func.timezone("utc", func.now())},
+    )
     user_count: int = Field(default=0)
     item_count: int = Field(default=0)
     audit_log_count: int = Field(default=0)
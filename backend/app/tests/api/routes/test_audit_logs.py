@@ -1,19 +1,21 @@
+import logging
 import uuid
 from datetime import datetime, timedelta, timezone
 import pytest
 from fastapi.testclient import TestClient
+from app import crud
+from app.core.async_audit import audit_writer
 from app.core.config import settings
-from app.models import AuditAction, AuditSeverity
+from app.models import AuditAction, AuditLogCreate, AuditSeverity, uuid7
+from app.tests.utils.audit_log import create_audit_logs, seed_audit_logs
 from app.tests.utils.user import create_random_user
-from app.tests.utils.tenant import get_or_create_default_tenant
 
 @pytest.fixture
 def normal_user(db):
     return create_random_user(db)
 
 @pytest.fixture
-def audit_log_data(superuser_token_headers, db, normal_user):
-    tenant = get_or_create_default_tenant(db)
+def audit_log_data(superuser_token_headers, default_tenant, normal_user):
     return [
         {
             "user_id": str(normal_user.id),
@@ -26,7 +28,7 @@ def audit_log_data(superuser_token_headers, db, normal_user):
             "after_state": {"foo": "baz"},
             "custom_metadata": {"meta": "data"},
             "severity": "INFO",
-            "tenant_id": str(tenant.id),
+            "tenant_id": str(default_tenant.id),
         },
         {
             "user_id": superuser_token_headers["user_id"] if "user_id" in superuser_token_headers else str(normal_user.id),
@@ -39,22 +41,13 @@ def audit_log_data(superuser_token_headers, db, normal_user):
             "after_state": {"foo": "qux"},
             "custom_metadata": {"meta": "data2"},
             "severity": "WARNING",
-            "tenant_id": str(tenant.id),
+            "tenant_id": str(default_tenant.id),
         },
     ]
 
 @pytest.fixture
-def created_audit_log_ids(client: TestClient, superuser_token_headers: dict, audit_log_data: list):
-    ids = []
-    for entry in audit_log_data:
-        response = client.post(
-            f"{settings.API_V1_STR}/audit-logs/",
-            headers=superuser_token_headers,
-            json=entry,
-        )
-        assert response.status_code == 200
-        ids.append(response.json()["id"])
-    return ids
+def created_audit_log_ids(db, audit_log_data: list):
+    return create_audit_logs(db, audit_log_data)
 
 def test_create_audit_log(client: TestClient, superuser_token_headers: dict, audit_log_data: list):
     for entry in audit_log_data:
@@ -71,6 +64,86 @@ def test_create_audit_log(client: TestClient, superuser_token_headers: dict, aud
         assert "id" in data
         assert "timestamp" in data
 
+def test_create_audit_log_is_persisted(client: TestClient, superuser_token_headers: dict, db, audit_log_data: list):
+    # The writer is opt-in, so run it for this test to cover queued entries
+    was_running = audit_writer.running
+    client.portal.call(audit_writer.start)
+    try:
+        response = client.post(
+            f"{settings.API_V1_STR}/audit-logs/",
+            headers=superuser_token_headers,
+            json=audit_log_data[0],
+        )
+        assert response.status_code == 200
+        audit_log_id = uuid.UUID(response.json()["id"])
+        # Stopping the writer flushes everything it has queued
+        client.portal.call(audit_writer.stop)
+        audit_log = crud.get_audit_log_by_id(session=db, audit_log_id=audit_log_id)
+        assert audit_log
+        assert audit_log.resource_id == audit_log_data[0]["resource_id"]
+    finally:
+        if was_running:
+            client.portal.call(audit_writer.start)
+        else:
+            client.portal.call(audit_writer.stop)
+
+def test_create_audit_log_unknown_user(client: TestClient, superuser_token_headers: dict, audit_log_data: list):
+    entry = {**audit_log_data[0], "user_id": str(uuid.uuid4())}
+    response = client.post(
+        f"{settings.API_V1_STR}/audit-logs/",
+        headers=superuser_token_headers,
+        json=entry,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Audit log user does not exist"
+
+def test_audit_writer_flush_isolates_bad_rows(db, audit_log_data: list, caplog: pytest.LogCaptureFixture):
+    rows = [
+        {**AuditLogCreate.model_validate(data).model_dump(), "id": uuid7()}
+        for data in audit_log_data
+    ]
+    bad_row = {**rows[0], "id": uuid7(), "user_id": uuid.uuid4()}
+    with caplog.at_level(logging.ERROR, logger="app.core.async_audit"):
+        audit_writer._flush([rows[0], bad_row, rows[1]])
+    for row in rows:
+        assert crud.get_audit_log_by_id(session=db, audit_log_id=row["id"])
+    assert not crud.get_audit_log_by_id(session=db, audit_log_id=bad_row["id"])
+    assert str(bad_row["id"]) in caplog.text
+
+def test_create_audit_log_sync(client: TestClient, superuser_token_headers: dict, audit_log_data: list):
+    entry = audit_log_data[0]
+    response = client.post(
+        f"{settings.API_V1_STR}/audit-logs/?sync=true",
+        headers=superuser_token_headers,
+        json=entry,
+    )
+    assert response.status_code == 200
+    audit_log_id = response.json()["id"]
+    response = client.get(
+        f"{settings.API_V1_STR}/audit-logs/{audit_log_id}",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["resource_id"] == entry["resource_id"]
+
+def test_create_audit_logs_bulk(client: TestClient, superuser_token_headers: dict, audit_log_data: list):
+    response = client.post(
+        f"{settings.API_V1_STR}/audit-logs/bulk",
+        headers=superuser_token_headers,
+        json=audit_log_data,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == len(audit_log_data)
+    assert len(set(data["ids"])) == len(audit_log_data)
+    for audit_log_id, entry in zip(data["ids"], audit_log_data, strict=True):
+        response = client.get(
+            f"{settings.API_V1_STR}/audit-logs/{audit_log_id}",
+            headers=superuser_token_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["custom_metadata"] == entry["custom_metadata"]
+
 def test_get_audit_log(client: TestClient, superuser_token_headers: dict, created_audit_log_ids):
     for audit_log_id in created_audit_log_ids:
         response = client.get(
@@ -116,15 +189,27 @@ def test_search_audit_logs(client: TestClient, superuser_token_headers: dict, cr
     data = response.json()
     assert any(log["user_id"] == user_id for log in data["data"])
 
+def test_read_audit_logs_paginated(client: TestClient, superuser_token_headers: dict, db, normal_user):
+    seed_audit_logs(db, user_id=normal_user.id, tenant_id=normal_user.tenant_id, n=250)
+    response = client.get(
+        f"{settings.API_V1_STR}/audit-logs/?user_id={normal_user.id}&skip=200&limit=100",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 250
+    assert len(data["data"]) == 50
+
 def test_export_audit_logs_csv(client: TestClient, superuser_token_headers: dict):
     response = client.get(
         f"{settings.API_V1_STR}/audit-logs/export/csv",
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
-    data = response.json()
-    assert data["csv_data"].startswith("ID,Timestamp,User ID,Action,Resource Type,Resource ID")
-    assert data["filename"].endswith(".csv")
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"].endswith(".csv")
+    lines = list(response.iter_lines())
+    assert lines[0].startswith("ID,Timestamp,User ID,Action,Resource Type,Resource ID")
 
 def test_delete_audit_log(client: TestClient, superuser_token_headers: dict, created_audit_log_ids):
     for audit_log_id in created_audit_log_ids:
@@ -141,10 +226,7 @@ def test_delete_audit_log(client: TestClient, superuser_token_headers: dict, cre
         )
         assert get_response.status_code == 404
 
-def test_websocket_audit_log():
-    from starlette.testclient import TestClient as StarletteTestClient
-    from app.main import app
-    with StarletteTestClient(app) as client:
-        with client.websocket_connect(f"{settings.API_V1_STR}/audit-logs/ws") as ws:
-            msg = ws.receive_text()
-            assert msg == "ping" 
\ No newline at end of file
+def test_websocket_audit_log(client: TestClient):
+    with client.websocket_connect(f"{settings.API_V1_STR}/audit-logs/ws") as ws:
+        msg = ws.receive_text()
+        assert msg == "ping" 
\ No newline at end of file
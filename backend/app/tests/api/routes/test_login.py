@@ -6,10 +6,9 @@ from sqlmodel import Session
 from app.core.config import settings
 from app.core.security import verify_password
 from app.crud import create_user
-from app.models import UserCreate, UserRole
+from app.models import Tenant, UserCreate, UserRole
 from app.tests.utils.user import user_authentication_headers
 from app.tests.utils.utils import random_email, random_lower_string
-from app.tests.utils.tenant import get_or_create_default_tenant
 from app.utils import generate_password_reset_token
 
 
@@ -73,11 +72,10 @@ def test_recovery_password_user_not_exits(
     assert r.status_code == 404
 
 
-def test_reset_password(client: TestClient, db: Session) -> None:
+def test_reset_password(client: TestClient, db: Session, default_tenant: Tenant) -> None:
     email = random_email()
     password = random_lower_string()
     new_password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
 
     user_create = UserCreate(
         email=email,
@@ -85,7 +83,7 @@ def test_reset_password(client: TestClient, db: Session) -> None:
         password=password,
         is_active=True,
         role=UserRole.USER,
-        tenant_id=tenant.id,
+        tenant_id=default_tenant.id,
     )
     user = create_user(session=db, user_create=user_create)
     token = generate_password_reset_token(email=email)
@@ -7,8 +7,11 @@ from sqlmodel import Session
 
 from app.core.config import settings
 from app.models import Tenant, TenantStatus, User
+from app.tests.utils.tenant import create_random_tenants, seed_tenant
 from app.tests.utils.user import create_random_user
 
+TENANTS_URL = f"{settings.API_V1_STR}/tenants/"
+
 
 @pytest.fixture
 def tenant_data() -> dict:
@@ -30,17 +33,25 @@ def tenant_data_2() -> dict:
     }
 
 
+@pytest.fixture
+def created_tenant(db: Session, tenant_data: dict) -> Tenant:
+    return seed_tenant(db, **tenant_data)
+
+
+@pytest.fixture
+def created_tenant_2(db: Session, tenant_data_2: dict) -> Tenant:
+    return seed_tenant(db, **tenant_data_2)
+
+
 def test_create_tenant(
     client: TestClient, superuser_token_headers: dict, tenant_data: dict
 ) -> None:
     response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
+        TENANTS_URL,
         headers=superuser_token_headers,
         json=tenant_data,
     )
-    print(f"Response status: {response.status_code}")
-    print(f"Response content: {response.text}")
-    assert response.status_code == 200
+    assert response.status_code == 200, response.text
     data = response.json()
     assert data["name"] == tenant_data["name"]
     assert data["description"] == tenant_data["description"]
@@ -56,7 +67,7 @@ def test_create_tenant_duplicate_code(
 ) -> None:
     # Create first tenant
     response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
+        TENANTS_URL,
         headers=superuser_token_headers,
         json=tenant_data,
     )
@@ -64,7 +75,7 @@ def test_create_tenant_duplicate_code(
     
     # Try to create second tenant with same code
     response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
+        TENANTS_URL,
         headers=superuser_token_headers,
         json=tenant_data,
     )
@@ -76,7 +87,7 @@ def test_create_tenant_normal_user(
     client: TestClient, normal_user_token_headers: dict, tenant_data: dict
 ) -> None:
     response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
+        TENANTS_URL,
         headers=normal_user_token_headers,
         json=tenant_data,
     )
@@ -84,22 +95,12 @@ def test_create_tenant_normal_user(
 
 
 def test_read_tenants(
-    client: TestClient, superuser_token_headers: dict, tenant_data: dict, tenant_data_2: dict
+    client: TestClient, db: Session, superuser_token_headers: dict
 ) -> None:
-    # Create two tenants
-    client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data,
-    )
-    client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data_2,
-    )
-    
+    create_random_tenants(db, 2)
+
     response = client.get(
-        f"{settings.API_V1_STR}/tenants/",
+        TENANTS_URL,
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
@@ -108,24 +109,11 @@ def test_read_tenants(
     assert data["count"] >= 2
 
 
-def test_read_tenants_with_search(
-    client: TestClient, superuser_token_headers: dict, tenant_data: dict, tenant_data_2: dict
-) -> None:
-    # Create two tenants
-    client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data,
-    )
-    client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data_2,
-    )
-    
+@pytest.mark.usefixtures("created_tenant", "created_tenant_2")
+def test_read_tenants_with_search(client: TestClient, superuser_token_headers: dict) -> None:
     # Search by name
     response = client.get(
-        f"{settings.API_V1_STR}/tenants/?search=Test",
+        f"{TENANTS_URL}?search=Test",
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
@@ -134,19 +122,11 @@ def test_read_tenants_with_search(
     assert any("Test" in tenant["name"] for tenant in data["data"])
 
 
-def test_read_tenants_with_status_filter(
-    client: TestClient, superuser_token_headers: dict, tenant_data: dict
-) -> None:
-    # Create tenant
-    client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data,
-    )
-    
+@pytest.mark.usefixtures("created_tenant")
+def test_read_tenants_with_status_filter(client: TestClient, superuser_token_headers: dict) -> None:
     # Filter by active status
     response = client.get(
-        f"{settings.API_V1_STR}/tenants/?status=active",
+        f"{TENANTS_URL}?status=active",
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
@@ -156,19 +136,13 @@ def test_read_tenants_with_status_filter(
 
 
 def test_read_tenant(
-    client: TestClient, superuser_token_headers: dict, tenant_data: dict
+    client: TestClient, superuser_token_headers: dict, tenant_data: dict, created_tenant: Tenant
 ) -> None:
-    # Create tenant
-    create_response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data,
-    )
-    tenant_id = create_response.json()["id"]
-    
+    tenant_id = str(created_tenant.id)
+
     # Read tenant
     response = client.get(
-        f"{settings.API_V1_STR}/tenants/{tenant_id}",
+        f"{TENANTS_URL}{tenant_id}",
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
@@ -177,28 +151,11 @@ def test_read_tenant(
     assert data["name"] == tenant_data["name"]
 
 
-def test_read_tenant_not_found(
-    client: TestClient, superuser_token_headers: dict
-) -> None:
-    fake_id = str(uuid.uuid4())
-    response = client.get(
-        f"{settings.API_V1_STR}/tenants/{fake_id}",
-        headers=superuser_token_headers,
-    )
-    assert response.status_code == 404
-
-
 def test_update_tenant(
-    client: TestClient, superuser_token_headers: dict, tenant_data: dict
+    client: TestClient, superuser_token_headers: dict, created_tenant: Tenant
 ) -> None:
-    # Create tenant
-    create_response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data,
-    )
-    tenant_id = create_response.json()["id"]
-    
+    tenant_id = str(created_tenant.id)
+
     # Update tenant
     update_data = {
         "name": "Updated Tenant Name",
@@ -206,7 +163,7 @@ def test_update_tenant(
         "status": "inactive"
     }
     response = client.patch(
-        f"{settings.API_V1_STR}/tenants/{tenant_id}",
+        f"{TENANTS_URL}{tenant_id}",
         headers=superuser_token_headers,
         json=update_data,
     )
@@ -218,26 +175,14 @@ def test_update_tenant(
 
 
 def test_update_tenant_duplicate_code(
-    client: TestClient, superuser_token_headers: dict, tenant_data: dict, tenant_data_2: dict
+    client: TestClient, superuser_token_headers: dict, created_tenant: Tenant, created_tenant_2: Tenant
 ) -> None:
-    # Create two tenants
-    tenant1_response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data,
-    )
-    tenant2_response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data_2,
-    )
-    
-    tenant1_id = tenant1_response.json()["id"]
-    
+    tenant1_id = str(created_tenant.id)
+
     # Try to update first tenant with second tenant's code
-    update_data = {"code": tenant_data_2["code"]}
+    update_data = {"code": created_tenant_2.code}
     response = client.patch(
-        f"{settings.API_V1_STR}/tenants/{tenant1_id}",
+        f"{TENANTS_URL}{tenant1_id}",
         headers=superuser_token_headers,
         json=update_data,
     )
@@ -245,33 +190,14 @@ def test_update_tenant_duplicate_code(
     assert "code already exists" in response.json()["detail"]
 
 
-def test_update_tenant_not_found(
-    client: TestClient, superuser_token_headers: dict
-) -> None:
-    fake_id = str(uuid.uuid4())
-    update_data = {"name": "Updated Name"}
-    response = client.patch(
-        f"{settings.API_V1_STR}/tenants/{fake_id}",
-        headers=superuser_token_headers,
-        json=update_data,
-    )
-    assert response.status_code == 404
-
-
 def test_delete_tenant(
-    client: TestClient, superuser_token_headers: dict, tenant_data: dict
+    client: TestClient, superuser_token_headers: dict, created_tenant: Tenant
 ) -> None:
-    # Create tenant
-    create_response = client.post(
-        f"{settings.API_V1_STR}/tenants/",
-        headers=superuser_token_headers,
-        json=tenant_data,
-    )
-    tenant_id = create_response.json()["id"]
-    
+    tenant_id = str(created_tenant.id)
+
     # Delete tenant
     response = client.delete(
-        f"{settings.API_V1_STR}/tenants/{tenant_id}",
+        f"{TENANTS_URL}{tenant_id}",
         headers=superuser_token_headers,
     )
     assert response.status_code == 200
@@ -279,18 +205,24 @@ def test_delete_tenant(
     
     # Verify tenant is deleted
     get_response = client.get(
-        f"{settings.API_V1_STR}/tenants/{tenant_id}",
+        f"{TENANTS_URL}{tenant_id}",
         headers=superuser_token_headers,
     )
     assert get_response.status_code == 404
 
 
-def test_delete_tenant_not_found(
-    client: TestClient, superuser_token_headers: dict
+@pytest.mark.parametrize(
+    "method,json",
+    [("GET", None), ("PATCH", {"name": "Updated Name"}), ("DELETE", None)],
+)
+def test_tenant_not_found(
+    client: TestClient, superuser_token_headers: dict, method: str, json: dict | None
 ) -> None:
     fake_id = str(uuid.uuid4())
-    response = client.delete(
-        f"{settings.API_V1_STR}/tenants/{fake_id}",
+    response = client.request(
+        method,
+        f"{TENANTS_URL}{fake_id}",
         headers=superuser_token_headers,
+        json=json,
     )
-    assert response.status_code == 404 
\ No newline at end of file
+    assert response.status_code == 404
@@ -7,9 +7,9 @@ from sqlmodel import Session, select
 from app import crud
 from app.core.config import settings
 from app.core.security import verify_password
-from app.models import User, UserCreate
+from app.models import Tenant, User, UserCreate
 from app.tests.utils.utils import random_email, random_lower_string
-from app.tests.utils.tenant import get_or_create_default_tenant
+from app.tests.utils.user import create_random_users
 
 
 def test_get_users_superuser_me(
@@ -35,7 +35,7 @@ def test_get_users_normal_user_me(
 
 
 def test_create_user_new_email(
-    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session, default_tenant: Tenant
 ) -> None:
     with (
         patch("app.utils.send_email", return_value=None),
@@ -44,8 +44,7 @@ def test_create_user_new_email(
     ):
         username = random_email()
         password = random_lower_string()
-        tenant = get_or_create_default_tenant(db)
-        data = {"email": username, "password": password, "tenant_id": str(tenant.id)}
+        data = {"email": username, "password": password, "tenant_id": str(default_tenant.id)}
         r = client.post(
             f"{settings.API_V1_STR}/users/",
             headers=superuser_token_headers,
@@ -59,12 +58,11 @@ def test_create_user_new_email(
 
 
 def test_get_existing_user(
-    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session, default_tenant: Tenant
 ) -> None:
     username = random_email()
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
+    user_in = UserCreate(email=username, password=password, tenant_id=default_tenant.id)
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
     r = client.get(
@@ -78,11 +76,10 @@ def test_get_existing_user(
     assert existing_user.email == api_user["email"]
 
 
-def test_get_existing_user_current_user(client: TestClient, db: Session) -> None:
+def test_get_existing_user_current_user(client: TestClient, db: Session, default_tenant: Tenant) -> None:
     username = random_email()
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
+    user_in = UserCreate(email=username, password=password, tenant_id=default_tenant.id)
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
 
@@ -118,15 +115,14 @@ def test_get_existing_user_permissions_error(
 
 
 def test_create_user_existing_username(
-    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session, default_tenant: Tenant
 ) -> None:
     username = random_email()
     # username = email
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
+    user_in = UserCreate(email=username, password=password, tenant_id=default_tenant.id)
     crud.create_user(session=db, user_create=user_in)
-    data = {"email": username, "password": password, "tenant_id": str(tenant.id)}
+    data = {"email": username, "password": password, "tenant_id": str(default_tenant.id)}
     r = client.post(
         f"{settings.API_V1_STR}/users/",
         headers=superuser_token_headers,
@@ -138,12 +134,11 @@ def test_create_user_existing_username(
 
 
 def test_create_user_by_normal_user(
-    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+    client: TestClient, normal_user_token_headers: dict[str, str], default_tenant: Tenant
 ) -> None:
     username = random_email()
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    data = {"email": username, "password": password, "tenant_id": str(tenant.id)}
+    data = {"email": username, "password": password, "tenant_id": str(default_tenant.id)}
     r = client.post(
         f"{settings.API_V1_STR}/users/",
         headers=normal_user_token_headers,
@@ -155,16 +150,7 @@ def test_create_user_by_normal_user(
 def test_retrieve_users(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
-    username = random_email()
-    password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
-    crud.create_user(session=db, user_create=user_in)
-
-    username2 = random_email()
-    password2 = random_lower_string()
-    user_in2 = UserCreate(email=username2, password=password2, tenant_id=tenant.id)
-    crud.create_user(session=db, user_create=user_in2)
+    create_random_users(db, 2)
 
     r = client.get(f"{settings.API_V1_STR}/users/", headers=superuser_token_headers)
     all_users = r.json()
@@ -253,12 +239,11 @@ def test_update_password_me_incorrect_password(
 
 
 def test_update_user_me_email_exists(
-    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+    client: TestClient, normal_user_token_headers: dict[str, str], db: Session, default_tenant: Tenant
 ) -> None:
     username = random_email()
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
+    user_in = UserCreate(email=username, password=password, tenant_id=default_tenant.id)
     user = crud.create_user(session=db, user_create=user_in)
 
     data = {"email": user.email}
@@ -290,12 +275,11 @@ def test_update_password_me_same_password_error(
     )
 
 
-def test_register_user(client: TestClient, db: Session) -> None:
+def test_register_user(client: TestClient, db: Session, default_tenant: Tenant) -> None:
     username = random_email()
     password = random_lower_string()
     full_name = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    data = {"email": username, "password": password, "full_name": full_name, "tenant_id": str(tenant.id)}
+    data = {"email": username, "password": password, "full_name": full_name, "tenant_id": str(default_tenant.id)}
     r = client.post(
         f"{settings.API_V1_STR}/users/signup",
         json=data,
@@ -330,12 +314,11 @@ def test_register_user_already_exists_error(client: TestClient) -> None:
 
 
 def test_update_user(
-    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session, default_tenant: Tenant
 ) -> None:
     username = random_email()
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
+    user_in = UserCreate(email=username, password=password, tenant_id=default_tenant.id)
     user = crud.create_user(session=db, user_create=user_in)
 
     data = {"full_name": "Updated_full_name"}
@@ -372,16 +355,7 @@ def test_update_user_not_exists(
 def test_update_user_email_exists(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
-    username = random_email()
-    password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
-    user = crud.create_user(session=db, user_create=user_in)
-
-    username2 = random_email()
-    password2 = random_lower_string()
-    user_in2 = UserCreate(email=username2, password=password2, tenant_id=tenant.id)
-    user2 = crud.create_user(session=db, user_create=user_in2)
+    user, user2 = create_random_users(db, 2)
 
     data = {"email": user2.email}
     r = client.patch(
@@ -393,11 +367,10 @@ def test_update_user_email_exists(
     assert r.json()["detail"] == "User with this email already exists"
 
 
-def test_delete_user_me(client: TestClient, db: Session) -> None:
+def test_delete_user_me(client: TestClient, db: Session, default_tenant: Tenant) -> None:
     username = random_email()
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
+    user_in = UserCreate(email=username, password=password, tenant_id=default_tenant.id)
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
 
@@ -438,12 +411,11 @@ def test_delete_user_me_as_superuser(
 
 
 def test_delete_user_super_user(
-    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session, default_tenant: Tenant
 ) -> None:
     username = random_email()
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
+    user_in = UserCreate(email=username, password=password, tenant_id=default_tenant.id)
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
     r = client.delete(
@@ -484,12 +456,11 @@ def test_delete_user_current_super_user_error(
 
 
 def test_delete_user_without_privileges(
-    client: TestClient, normal_user_token_headers: dict[str, str], db: Session
+    client: TestClient, normal_user_token_headers: dict[str, str], db: Session, default_tenant: Tenant
 ) -> None:
     username = random_email()
     password = random_lower_string()
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=username, password=password, tenant_id=tenant.id)
+    user_in = UserCreate(email=username, password=password, tenant_id=default_tenant.id)
     user = crud.create_user(session=db, user_create=user_in)
     user_id = user.id
     r = client.delete(
@@ -1,15 +1,44 @@
+import os
 from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, delete
+from sqlalchemy import text
+from sqlmodel import Session
 
+from app.core.audit_file_sink import audit_file_sink
 from app.core.config import settings
-from app.core.db import engine, init_db
-from app.main import app
-from app.models import AuditLog, Item, User
-from app.tests.utils.user import authentication_token_from_email
-from app.tests.utils.utils import get_superuser_token_headers
+from app.tests.utils.database import (
+    create_worker_database,
+    drop_worker_database,
+    use_worker_database,
+)
+
+# Under pytest-xdist (`pytest -n auto`) every worker gets its own database, so
+# one worker's session teardown can't delete rows another worker is using.
+# Only the name is switched here, before app.core.db builds the engine; the
+# database itself is created in pytest_configure.
+_base_database: str | None = None
+if worker_id := os.environ.get("PYTEST_XDIST_WORKER"):
+    _base_database = use_worker_database(worker_id)
+
+from app.core.db import engine, init_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Tenant  # noqa: E402
+from app.tests.utils.tenant import get_or_create_default_tenant  # noqa: E402
+from app.tests.utils.user import authentication_token_from_email  # noqa: E402
+from app.tests.utils.utils import get_superuser_token_headers  # noqa: E402
+
+
+def pytest_configure() -> None:
+    if _base_database:
+        create_worker_database(_base_database)
+
+
+def pytest_unconfigure() -> None:
+    if _base_database:
+        engine.dispose()
+        drop_worker_database(_base_database)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -17,23 +46,56 @@ def db() -> Generator[Session, None, None]:
     with Session(engine) as session:
         init_db(session)
         yield session
-        statement = delete(AuditLog)
-        session.execute(statement)
-        statement = delete(Item)
-        session.execute(statement)
-        statement = delete(User)
-        session.execute(statement)
+        # TRUNCATE drops the rows wholesale instead of scanning and
+        # WAL-logging each deleted row like DELETE does
+        session.execute(text('TRUNCATE audit_log, item, "user"'))
         session.commit()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session", autouse=True)
+def disable_audit_file_sink() -> Generator[None, None, None]:
+    # Tests read audit logs straight back, so never leave them in JSONL files
+    # (or leak those files) even when .env sets AUDIT_FILE_SINK_DIR
+    directory = audit_file_sink.directory
+    audit_file_sink.directory = None
+    yield
+    audit_file_sink.directory = directory
+
+
+@pytest.fixture(scope="session")
+def default_tenant(db: Session) -> Tenant:
+    return get_or_create_default_tenant(db)
+
+
+@pytest.fixture
+def rollback_db() -> Generator[Session, None, None]:
+    """
+    Session whose writes are rolled back after the test.
+
+    Commits inside the test only release a SAVEPOINT, so nothing reaches disk
+    and nothing has to be deleted afterwards. Only for tests that don't go
+    through the API, since requests use their own connections. Tests that
+    need the default tenant request the session-scoped ``default_tenant``,
+    which is committed before this fixture runs.
+    """
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+            yield session
+        transaction.rollback()
+
+
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
+    # One app lifespan (audit writer, partition check) for the whole run
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def superuser_token_headers(client: TestClient) -> dict[str, str]:
+    # The superuser is created once by init_db (in the autouse db fixture), so
+    # log in once per session
     return get_superuser_token_headers(client)
 
 
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, func, select
+
+from app.core.config import settings
+from app.core.db import engine
+from app.core.optimization import (
+    PARTITION_LOCK_KEY,
+    DatabaseOptimizer,
+    _add_months,
+    _month_start,
+    _partition_name,
+    apply_audit_log_retention,
+    ensure_audit_log_partitions,
+    optimize_database,
+)
+from app.models import AuditLog, User
+from app.tests.utils.audit_log import seed_audit_logs
+from app.tests.utils.user import create_random_user
+
+
+def _seed_old_audit_logs(db: Session, n: int) -> User:
+    user = create_random_user(db)
+    two_years_ago = datetime.now(timezone.utc) - timedelta(days=730)
+    seed_audit_logs(db, user_id=user.id, tenant_id=user.tenant_id, n=n, timestamp=two_years_ago)
+    return user
+
+
+def _audit_log_count(db: Session, user: User) -> int:
+    return db.exec(select(func.count()).where(AuditLog.user_id == user.id)).one()
+
+
+def test_optimize_database_keeps_audit_logs_without_retention(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "AUDIT_LOG_RETENTION_MONTHS", None)
+    user = _seed_old_audit_logs(db, 3)
+
+    optimize_database()
+
+    assert _audit_log_count(db, user) == 3
+
+
+def test_apply_audit_log_retention_without_retention(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "AUDIT_LOG_RETENTION_MONTHS", None)
+    user = _seed_old_audit_logs(db, 3)
+
+    results = apply_audit_log_retention()
+
+    assert results["dropped_partitions"] == []
+    assert results["deleted_audit_logs"] == 0
+    assert _audit_log_count(db, user) == 3
+
+
+def test_apply_audit_log_retention_deletes_expired(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "AUDIT_LOG_RETENTION_MONTHS", 12)
+    user = _seed_old_audit_logs(db, 3)
+
+    apply_audit_log_retention()
+
+    assert _audit_log_count(db, user) == 0
+
+
+def _partition_exists(db: Session, name: str) -> bool:
+    return db.execute(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+    ).scalar()
+
+
+def test_ensure_audit_log_partitions_creates_upcoming_months(db: Session) -> None:
+    assert ensure_audit_log_partitions()
+
+    month = _month_start(datetime.now(timezone.utc))
+    for months in range(settings.AUDIT_LOG_PARTITION_MONTHS_AHEAD + 1):
+        assert _partition_exists(db, _partition_name(_add_months(month, months)))
+
+
+def test_create_partitioned_tables_skips_while_locked() -> None:
+    with engine.connect() as connection, Session(engine) as session:
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+        try:
+            # Another worker holds the lock: skip instead of racing its DDL
+            assert DatabaseOptimizer(session).create_partitioned_tables(months_ahead=24)
+            far_month = _add_months(_month_start(datetime.now(timezone.utc)), 24)
+            assert not _partition_exists(session, _partition_name(far_month))
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": PARTITION_LOCK_KEY})
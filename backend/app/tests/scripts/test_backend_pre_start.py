@@ -1,6 +1,6 @@
 from unittest.mock import MagicMock, patch
 
-from app.backend_pre_start import logger
+from app.backend_pre_start import _init_impl, logger
 
 
 def test_init_successful_connection() -> None:
@@ -11,18 +11,9 @@ def test_init_successful_connection() -> None:
         patch.object(logger, "error"),
         patch.object(logger, "warn"),
     ):
-        # Test the actual init function without retry decorator
-        def init_test(db_engine):
-            try:
-                from sqlmodel import Session, select
-                with Session(db_engine) as session:
-                    session.exec(select(1))
-            except Exception as e:
-                logger.error(e)
-                raise e
-        
+        # Call the connection check directly, without the retry policy
         try:
-            init_test(engine_mock)
+            _init_impl(engine_mock)
             connection_successful = True
         except Exception:
             connection_successful = False
@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app import crud
+from app.models import AuditLogCreate, uuid7
+
+
+def create_audit_logs(db: Session, audit_logs_data: list[dict[str, Any]]) -> list[str]:
+    """Insert audit logs in a single round-trip and return their ids."""
+    rows = [
+        {**AuditLogCreate.model_validate(data).model_dump(), "id": uuid7()}
+        for data in audit_logs_data
+    ]
+    crud.bulk_create_audit_logs(session=db, rows=rows)
+    return [str(row["id"]) for row in rows]
+
+
+def seed_audit_logs(
+    db: Session,
+    *,
+    user_id: uuid.UUID,
+    tenant_id: uuid.UUID,
+    n: int,
+    timestamp: datetime | None = None,
+) -> None:
+    """Insert ``n`` audit logs server-side with one INSERT ... SELECT generate_series."""
+    db.execute(
+        text(
+            "INSERT INTO audit_log"
+            " (id, user_id, action, resource_type, resource_id, severity, tenant_id, timestamp)"
+            " SELECT gen_random_uuid(), :user_id, 'CREATE', 'seed', i::text, 'INFO',"
+            " :tenant_id, :timestamp"
+            " FROM generate_series(1, :n) AS i"
+        ),
+        {
+            "user_id": user_id,
+            "tenant_id": tenant_id,
+            "timestamp": timestamp or datetime.now(timezone.utc),
+            "n": n,
+        },
+    )
+    db.commit()
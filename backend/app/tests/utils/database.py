@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, make_url, text
+
+from app.core.config import settings
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+def use_worker_database(worker_id: str) -> str:
+    """
+    Point settings at the database of one pytest-xdist worker and return the
+    name of the database they pointed at before. Doesn't touch the server;
+    must run before app.core.db is imported.
+    """
+    base_name = settings.POSTGRES_DB
+    settings.POSTGRES_DB = f"{base_name}_{worker_id}"
+    return base_name
+
+
+def _admin_engine(base_name: str):
+    url = make_url(str(settings.SQLALCHEMY_DATABASE_URI)).set(database=base_name)
+    return create_engine(url, isolation_level="AUTOCOMMIT")
+
+
+def create_worker_database(base_name: str) -> None:
+    """Recreate the worker database settings point at and migrate it."""
+    name = settings.POSTGRES_DB
+    admin_engine = _admin_engine(base_name)
+    with admin_engine.connect() as connection:
+        connection.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+        connection.execute(text(f'CREATE DATABASE "{name}"'))
+    admin_engine.dispose()
+
+    alembic_config = Config(str(BACKEND_DIR / "alembic.ini"))
+    alembic_config.set_main_option("script_location", str(BACKEND_DIR / "app" / "alembic"))
+    command.upgrade(alembic_config, "head")
+
+
+def drop_worker_database(base_name: str) -> None:
+    admin_engine = _admin_engine(base_name)
+    with admin_engine.connect() as connection:
+        connection.execute(
+            text(f'DROP DATABASE IF EXISTS "{settings.POSTGRES_DB}" WITH (FORCE)')
+        )
+    admin_engine.dispose()
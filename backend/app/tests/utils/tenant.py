@@ -4,29 +4,41 @@ from app.models import Tenant, TenantCreate
 from app.tests.utils.utils import random_lower_string
 
 
+_DEFAULT_FEATURES = {
+    "audit_logs": True,
+    "user_management": True,
+    "item_management": True
+}
+
+
 def create_random_tenant(db: Session) -> Tenant:
     """Create a random tenant for testing."""
-    name = random_lower_string()
-    code = random_lower_string()
-    description = random_lower_string()
-    tenant_in = TenantCreate(
-        name=name,
-        code=code,
-        description=description,
-        max_users=100,
-        max_storage_gb=10,
-        features_enabled={
-            "audit_logs": True,
-            "user_management": True,
-            "item_management": True
-        }
-    )
-    tenant = crud.create_tenant(session=db, tenant_create=tenant_in, user_id=None)
-    return tenant
+    return create_random_tenants(db, 1)[0]
+
+
+def create_random_tenants(db: Session, n: int) -> list[Tenant]:
+    """Create ``n`` random tenants with a single commit."""
+    tenants_in = [
+        TenantCreate(
+            name=random_lower_string(),
+            code=random_lower_string(),
+            description=random_lower_string(),
+            max_users=100,
+            max_storage_gb=10,
+            features_enabled=_DEFAULT_FEATURES
+        )
+        for _ in range(n)
+    ]
+    return crud.create_tenants(session=db, tenant_creates=tenants_in, user_id=None)
 
 
 def get_or_create_default_tenant(db: Session) -> Tenant:
-    """Get the default tenant or create it if it doesn't exist."""
+    """
+    Get the default tenant or create it if it doesn't exist.
+
+    Tests should request the session-scoped ``default_tenant`` fixture
+    instead; this is for helpers that only have a session.
+    """
     tenant = crud.get_tenant_by_code(session=db, code="default")
     if not tenant:
         tenant_in = TenantCreate(
@@ -35,11 +47,12 @@ def get_or_create_default_tenant(db: Session) -> Tenant:
             description="Default tenant for testing",
             max_users=1000,
             max_storage_gb=100,
-            features_enabled={
-                "audit_logs": True,
-                "user_management": True,
-                "item_management": True
-            }
+            features_enabled=_DEFAULT_FEATURES
         )
         tenant = crud.create_tenant(session=db, tenant_create=tenant_in, user_id=None)
-    return tenant 
\ No newline at end of file
+    return tenant
+
+
+def seed_tenant(db: Session, **fields) -> Tenant:
+    """Insert a tenant directly, for tests that only need one to exist."""
+    return crud.create_tenant(session=db, tenant_create=TenantCreate(**fields), user_id=None)
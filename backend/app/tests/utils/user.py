@@ -1,8 +1,11 @@
+from functools import lru_cache
+
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app import crud
 from app.core.config import settings
+from app.core.security import get_password_hash
 from app.models import User, UserCreate, UserUpdate
 from app.tests.utils.utils import random_email, random_lower_string
 from app.tests.utils.tenant import get_or_create_default_tenant
@@ -20,16 +23,31 @@ def user_authentication_headers(
     return headers
 
 
+@lru_cache
+def _prehashed_password() -> str:
+    # Random users never log in, so hash one password once instead of per user
+    return get_password_hash(random_lower_string())
+
+
 def create_random_user(db: Session) -> User:
-    email = random_email()
-    password = random_lower_string()
-    # Get or create default tenant
-    tenant = get_or_create_default_tenant(db)
-    user_in = UserCreate(email=email, password=password, tenant_id=tenant.id)
-    user = crud.create_user(session=db, user_create=user_in)
+    user = create_random_users(db, 1)[0]
+    db.refresh(user)
     return user
 
 
+def create_random_users(db: Session, n: int) -> list[User]:
+    """Insert ``n`` users of the default tenant with a single commit."""
+    tenant = get_or_create_default_tenant(db)
+    password = _prehashed_password()
+    users = [
+        User(email=random_email(), hashed_password=password, tenant_id=tenant.id)
+        for _ in range(n)
+    ]
+    db.add_all(users)
+    db.commit()
+    return users
+
+
 def authentication_token_from_email(
     *, client: TestClient, email: str, db: Session
 ) -> dict[str, str]:
@@ -143,7 +143,7 @@ export class AuditLogsService {
      * @param data.tenantId Filter by tenant ID
      * @param data.startDate Start date for filtering
      * @param data.endDate End date for filtering
-     * @returns AuditLogExport Successful Response
+     * @returns unknown Audit logs as CSV
      * @throws ApiError
      */
     public static exportAuditLogsCsv(data: AuditLogsExportAuditLogsCsvData = {}): CancelablePromise<AuditLogsExportAuditLogsCsvResponse> {
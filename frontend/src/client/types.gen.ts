@@ -24,11 +24,6 @@ export type AuditLogCreate = {
     session_id?: (string | null);
 };
 
-export type AuditLogExport = {
-    csv_data: string;
-    filename: string;
-};
-
 export type AuditLogPublic = {
     user_id: string;
     action: AuditAction;
@@ -341,7 +336,7 @@ export type AuditLogsExportAuditLogsCsvData = {
     userId?: (string | null);
 };
 
-export type AuditLogsExportAuditLogsCsvResponse = (AuditLogExport);
+export type AuditLogsExportAuditLogsCsvResponse = (unknown);
 
 export type ItemsReadItemsData = {
     limit?: number;
@@ -102,20 +102,20 @@ export const useAuditLogExport = () => {
         if (filters?.start_date) apiParams.startDate = filters.start_date
         if (filters?.end_date) apiParams.endDate = filters.end_date
         
-        const response = await AuditLogsService.exportAuditLogsCsv(apiParams)
+        const csvData = await AuditLogsService.exportAuditLogsCsv(apiParams) as string
         
         // Create and download file
-        const blob = new Blob([response.csv_data], { type: "text/csv" })
+        const blob = new Blob([csvData], { type: "text/csv" })
         const url = URL.createObjectURL(blob)
         const a = document.createElement("a")
         a.href = url
-        a.download = response.filename
+        a.download = `audit-logs-${new Date().toISOString().split('T')[0]}.csv`
         document.body.appendChild(a)
         a.click()
         document.body.removeChild(a)
         URL.revokeObjectURL(url)
         
-        return response
+        return csvData
       } else {
         // For JSON, fetch the data and convert to JSON format
         const apiParams: any = {